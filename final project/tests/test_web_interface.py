@@ -3,7 +3,6 @@ Test what the web interface receives from the API
 """
 
 import requests
-import json
 from pathlib import Path
 
 def test_web_interface_data():
@@ -67,9 +66,8 @@ def test_web_interface_data():
                 else:
                     print("❌ No summary found!")
             
-            # Save the full response for debugging
-            with open('web_interface_test_result.json', 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            # Save the full response for debugging (raw body, no re-serialization)
+            Path('web_interface_test_result.json').write_bytes(response.content)
             print(f"\n💾 Full response saved to: web_interface_test_result.json")
             
             return True
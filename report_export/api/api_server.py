@@ -15,7 +15,7 @@ Features:
 This API provides the most complete extraction capabilities for lighting analysis reports.
 """
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, Response
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import os
@@ -26,7 +26,10 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from extractors.final_extractor import FinalPDFExtractor
-import uuid
+import itertools
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # Initialize Flask app
@@ -34,6 +37,9 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 app.config['JSON_AS_ASCII'] = False
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+# Behind nginx/Apache, let the front server stream downloads with sendfile(2)
+# (nginx needs an X-Sendfile/X-Accel-Redirect mapping for OUTPUT_FOLDER)
+app.use_x_sendfile = os.environ.get('USE_X_SENDFILE', '0') == '1'
 
 # Enable CORS for all routes
 CORS(app)
@@ -42,6 +48,11 @@ CORS(app)
 UPLOAD_FOLDER = 'api_uploads'
 OUTPUT_FOLDER = 'api_outputs'
 ALLOWED_EXTENSIONS = {'pdf'}
+_ALLOWED_SUFFIXES = tuple(f'.{ext}' for ext in ALLOWED_EXTENSIONS)
+# Number of extraction worker processes (CPU-bound work runs outside the request threads)
+EXTRACT_WORKERS = int(os.environ.get('EXTRACT_WORKERS', os.cpu_count() or 1))
+# Request-handling threads when served by waitress
+SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 16))
 
 # Create folders if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -57,18 +68,122 @@ except Exception as e:
     from extractors.enhanced_parser import process_report
     extractor = None
 
+# Unique upload names: server start time + PID are fixed per process, a counter
+# distinguishes uploads within it (no clock or entropy syscalls per request)
+_FILENAME_PREFIX = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+_FILENAME_COUNTER = itertools.count(1)
+
+# Process pool running the extractions, created on first use
+_EXECUTOR = None
+_executor_lock = threading.Lock()
+
+# Single-flight map: SHA-256 of an upload -> Future of its extraction result.
+# Concurrent uploads of the same PDF wait on the first extraction instead of re-parsing.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Pretty-printing encoder used to stream responses; chunks are flushed at ~64KB
+_STREAM_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
 
 def generate_unique_filename(original_filename):
     """Generate unique filename to avoid conflicts"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
     name, ext = os.path.splitext(original_filename)
-    return f"{name}_{timestamp}_{unique_id}{ext}"
+    return f"{name}_{_FILENAME_PREFIX}_{next(_FILENAME_COUNTER)}{ext}"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Compute the SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stream_json(obj):
+    """
+    Serialize obj incrementally, yielding UTF-8 chunks.
+
+    The encoded document is never held in memory as a single string, so a
+    large extraction result only costs its own size rather than twice that.
+    Encoding errors surface after the response status is sent, so callers
+    must check that obj encodes (e.g. by saving it) before streaming it.
+    """
+    buf = []
+    size = 0
+    for piece in _STREAM_ENCODER.iterencode(obj):
+        buf.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(buf).encode("utf-8")
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def _init_extract_worker():
+    """Pool initializer: uploads already fill the pool; one process per extraction"""
+    if extractor:
+        extractor.workers = 1
+
+
+def _do_extract(upload_path):
+    """Run the configured extractor on a saved upload"""
+    if extractor:
+        # Use Final PDF Extractor (preferred method)
+        print("Using Final PDF Extractor with alias mapping...")
+        return extractor.process_report(upload_path)
+    # Fallback to enhanced parser
+    print("Using enhanced parser fallback...")
+    return process_report(upload_path)
+
+
+def _get_executor():
+    """Return the extraction process pool, creating it on first use"""
+    global _EXECUTOR
+    with _executor_lock:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS, initializer=_init_extract_worker)
+        return _EXECUTOR
+
+
+def _discard_inflight(sha, fut):
+    """Drop a finished extraction from the single-flight map"""
+    with _inflight_lock:
+        if _inflight.get(sha) is fut:
+            del _inflight[sha]
+
+
+def extract_once(upload_path, sha):
+    """
+    Extract a PDF in the worker pool, coalescing requests for identical content.
+
+    The first request for a given hash submits the extraction; any request that
+    arrives while it is still running waits for the same result. Each caller
+    gets its own top-level copy so per-request cleanup does not race.
+    """
+    with _inflight_lock:
+        fut = _inflight.get(sha)
+        submitted = fut is None
+        if submitted:
+            fut = _get_executor().submit(_do_extract, upload_path)
+            _inflight[sha] = fut
+
+    # Registered outside the lock: the callback runs inline if the future is already done
+    if submitted:
+        fut.add_done_callback(lambda f: _discard_inflight(sha, f))
+    else:
+        print(f"Waiting for in-flight extraction of identical upload ({sha[:12]})")
+
+    return dict(fut.result())
 
 
 @app.route('/', methods=['GET'])
@@ -153,23 +268,17 @@ def extract_pdf():
         
         # Extract data from PDF using Final PDF Extractor
         print(f"Processing uploaded file: {unique_filename}")
-        
-        if extractor:
-            # Use Final PDF Extractor (preferred method)
-            print("Using Final PDF Extractor with alias mapping...")
-            result = extractor.process_report(upload_path)
-        else:
-            # Fallback to enhanced parser
-            print("Using enhanced parser fallback...")
-            result = process_report(upload_path)
+        result = extract_once(upload_path, file_sha256(upload_path))
         
         # Generate output filename
         output_filename = f"{os.path.splitext(unique_filename)[0]}_extracted.json"
         output_path = os.path.join(OUTPUT_FOLDER, output_filename)
         
-        # Save extracted data
+        # Save extracted data with the response's encoder. This is also the
+        # check that the result encodes at all: the response below is streamed
+        # after its 200 status is sent, too late to report an encoding error
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+            f.writelines(_STREAM_ENCODER.iterencode(result))
         
         # Generate file ID for download
         file_id = os.path.splitext(output_filename)[0]
@@ -178,11 +287,8 @@ def extract_pdf():
         os.remove(upload_path)
         
         # Return success response
-        from flask import Response
-
         # Optional cleanup
-        if "_debug" in result:
-            del result["_debug"]
+        result.pop("_debug", None)
 
         response_data = {
             "success": True,
@@ -194,9 +300,9 @@ def extract_pdf():
             "timestamp": datetime.now().isoformat()
         }
 
-        # ✅ Force UTF-8 and full JSON content
+        # ✅ Force UTF-8 and full JSON content, streamed as it is encoded
         return Response(
-            json.dumps(response_data, indent=4, ensure_ascii=False),
+            stream_json(response_data),
             mimetype='application/json; charset=utf-8'
         )
         
@@ -204,6 +310,9 @@ def extract_pdf():
         # Clean up uploaded file if it exists
         if 'upload_path' in locals() and os.path.exists(upload_path):
             os.remove(upload_path)
+        # and a result file left half-written by an encoding error
+        if 'output_path' in locals() and os.path.exists(output_path):
+            os.remove(output_path)
         
         return jsonify({
             "error": "Processing failed",
@@ -257,7 +366,8 @@ def download_file(file_id):
                 "message": f"No file found with ID: {file_id}"
             }), 404
         
-        return send_file(file_path, as_attachment=True, download_name=filename)
+        # Absolute path: required for X-Sendfile and independent of the app root
+        return send_file(os.path.abspath(file_path), as_attachment=True, download_name=filename)
         
     except Exception as e:
         return jsonify({
@@ -314,7 +424,14 @@ if __name__ == '__main__':
     print("  ✓ Robust error handling and fallback mechanisms")
     print("=" * 60)
     print("Server will start on http://localhost:5000")
+    print(f"Extraction workers: {EXTRACT_WORKERS}")
     print("Press Ctrl+C to stop the server")
     print("=" * 60)
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    # Prefer a production WSGI server when available; fall back to Flask's dev server
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=SERVER_THREADS)
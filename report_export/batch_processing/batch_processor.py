@@ -8,20 +8,93 @@ in an output folder.
 
 import os
 import sys
-import json
+import logging
 from pathlib import Path
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__ and "." in __package__:
+    # python -m report_export.batch_processing.<script>
+    from ..extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+    from .json_io import dump_json
+    from .prefetch import prefetched
+    from .worker_logging import ensure_console_logging, start_log_listener, install_queue_handler
+else:
+    if not __package__:
+        # Run directly as a script: make report_export importable
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+    from batch_processing.json_io import dump_json
+    from batch_processing.prefetch import prefetched
+    from batch_processing.worker_logging import ensure_console_logging, start_log_listener, install_queue_handler
+
+logger = logging.getLogger(__name__)
+
+# Per-process extractor, built once per worker and reused for every file
+_EXTRACTOR = None
+
+
+def _get_extractor():
+    """Return this process's extractor, creating it on first use"""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = LayoutEnhancedExtractor()
+    return _EXTRACTOR
+
+
+def _init_worker(log_queue=None, log_level=logging.INFO):
+    """Pool initializer: route logging to the parent and build the extractor up front"""
+    if log_queue is not None:
+        install_queue_handler(log_queue, log_level)
+    _get_extractor()
+
+
+def _is_up_to_date(pdf_path, output_path):
+    """True if output_path exists and was written after pdf_path was last modified"""
+    try:
+        return os.stat(output_path).st_mtime > os.stat(pdf_path).st_mtime
+    except OSError:
+        return False
+
+
+def _process_one(pdf_path, output_path, extractor=None):
+    """
+    Process a single PDF file and save its JSON report to output_path.
+
+    Module-level so it can run in a worker process; each worker reuses one
+    cached extractor instead of receiving a pickled one.
+
+    Returns:
+        tuple: (success, output path or error message)
+    """
+    pdf_name = os.path.basename(pdf_path)
+    try:
+        logger.info(f"Processing: {pdf_name}")
+        
+        if extractor is None:
+            extractor = _get_extractor()
+        
+        # Extract data
+        result = extractor.process_report(str(pdf_path))
+        
+        # Save results
+        dump_json(result, output_path)
+        
+        logger.info(f"✓ Saved: {output_path}")
+        return True, str(output_path)
+        
+    except Exception as e:
+        logger.error(f"✗ Error processing {pdf_name}: {e}")
+        return False, str(e)
 
 
 class BatchProcessor:
     """Batch processor for multiple PDF files"""
     
-    def __init__(self, input_folder=".", output_folder="output"):
+    def __init__(self, input_folder=".", output_folder="output", workers=None, force=False):
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder)
+        self.workers = workers or os.cpu_count() or 1
+        self.force = force
         self.extractor = LayoutEnhancedExtractor()
         
         # Create output folder if it doesn't exist
@@ -29,61 +102,83 @@ class BatchProcessor:
     
     def get_pdf_files(self):
         """Get all PDF files from input folder"""
-        pdf_files = list(self.input_folder.glob("*.pdf"))
+        # scandir reuses the directory entry's cached type instead of a glob match + stat per file
+        with os.scandir(self.input_folder) as entries:
+            pdf_files = [Path(e.path) for e in entries
+                         if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".pdf")]
         return pdf_files
     
+    def output_path_for(self, pdf_path):
+        """Output report path for a PDF (same name with an _extracted.json suffix)"""
+        return self.output_folder / (Path(pdf_path).stem + "_extracted.json")
+    
     def process_single_file(self, pdf_path):
         """Process a single PDF file"""
-        try:
-            print(f"Processing: {pdf_path.name}")
-            
-            # Extract data
-            result = self.extractor.process_report(str(pdf_path))
-            
-            # Create output filename (same name as PDF but with .json extension)
-            output_filename = pdf_path.stem + "_extracted.json"
-            output_path = self.output_folder / output_filename
-            
-            # Save results
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=4, ensure_ascii=False)
-            
-            print(f"✓ Saved: {output_path}")
-            return True, str(output_path)
-            
-        except Exception as e:
-            print(f"✗ Error processing {pdf_path.name}: {e}")
-            return False, str(e)
+        return _process_one(str(pdf_path), str(self.output_path_for(pdf_path)), self.extractor)
     
     def process_all_files(self):
         """Process all PDF files in the input folder"""
+        # Progress goes to the console unless the caller configured logging
+        ensure_console_logging()
         pdf_files = self.get_pdf_files()
         
         if not pdf_files:
-            print(f"No PDF files found in: {self.input_folder}")
+            logger.info(f"No PDF files found in: {self.input_folder}")
             return
         
-        print(f"Found {len(pdf_files)} PDF files to process")
-        print(f"Input folder: {self.input_folder}")
-        print(f"Output folder: {self.output_folder}")
-        print("=" * 60)
+        logger.info(f"Found {len(pdf_files)} PDF files to process")
+        logger.info(f"Input folder: {self.input_folder}")
+        logger.info(f"Output folder: {self.output_folder}")
+        logger.info("=" * 60)
+        
+        # Resolve every (input, output) pair up front; workers only receive plain strings
+        inputs = [str(pdf_file) for pdf_file in pdf_files]
+        outputs = [str(self.output_path_for(pdf_file)) for pdf_file in pdf_files]
+        
+        # Reports newer than their PDF are kept as-is unless forced
+        todo = [i for i in range(len(pdf_files))
+                if self.force or not _is_up_to_date(inputs[i], outputs[i])]
+        todo_inputs = [inputs[i] for i in todo]
+        todo_outputs = [outputs[i] for i in todo]
+        skipped = len(pdf_files) - len(todo)
+        if skipped:
+            logger.info(f"Skipping {skipped} up-to-date file(s); use --force to reprocess")
         
+        workers = min(self.workers, len(todo))
+        if workers <= 1:
+            # Read the next files from disk while the current one is parsed
+            done = [_process_one(src, dst, self.extractor)
+                    for src, dst in zip(prefetched(todo_inputs), todo_outputs)]
+        else:
+            # PDF parsing is CPU-bound, so spread files across processes
+            logger.info(f"Using {workers} worker processes")
+            # map keeps results in input order so the summary is deterministic;
+            # chunking sends several files per round trip to a worker
+            chunksize = max(1, len(todo) // (4 * workers))
+            # Workers queue their log records; one listener thread here writes them out
+            log_queue, listener = start_log_listener()
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(log_queue, logging.getLogger().getEffectiveLevel())) as executor:
+                    done = list(executor.map(_process_one, todo_inputs, todo_outputs, chunksize=chunksize))
+            finally:
+                listener.stop()
+        
+        outcomes = [None] * len(pdf_files)
+        for i, outcome in zip(todo, done):
+            outcomes[i] = outcome
+        
+        # Fixed-size entries only; the extracted data itself lives in each output file
         results = []
-        successful = 0
-        failed = 0
-        
-        for pdf_file in pdf_files:
-            success, result = self.process_single_file(pdf_file)
-            results.append({
-                "file": pdf_file.name,
-                "success": success,
-                "result": result
-            })
-            
-            if success:
-                successful += 1
+        for pdf_file, output, outcome in zip(pdf_files, outputs, outcomes):
+            if outcome is None:
+                results.append({"file": pdf_file.name, "success": True, "skipped": True, "output": output})
             else:
-                failed += 1
+                success, result = outcome
+                results.append({"file": pdf_file.name, "success": success,
+                                "output" if success else "error": result})
+        failed = sum(1 for r in results if not r["success"])
+        successful = len(results) - failed - skipped
         
         # Save batch summary
         summary = {
@@ -91,6 +186,7 @@ class BatchProcessor:
                 "total_files": len(pdf_files),
                 "successful": successful,
                 "failed": failed,
+                "skipped": skipped,
                 "input_folder": str(self.input_folder),
                 "output_folder": str(self.output_folder)
             },
@@ -98,21 +194,24 @@ class BatchProcessor:
         }
         
         summary_path = self.output_folder / "batch_summary.json"
-        with open(summary_path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=4, ensure_ascii=False)
+        dump_json(summary, summary_path)
         
-        print("\n" + "=" * 60)
-        print("BATCH PROCESSING COMPLETED")
-        print("=" * 60)
-        print(f"Total files: {len(pdf_files)}")
-        print(f"Successful: {successful}")
-        print(f"Failed: {failed}")
-        print(f"Summary saved to: {summary_path}")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("BATCH PROCESSING COMPLETED")
+        logger.info("=" * 60)
+        logger.info(f"Total files: {len(pdf_files)}")
+        logger.info(f"Successful: {successful}")
+        logger.info(f"Failed: {failed}")
+        logger.info(f"Skipped (up to date): {skipped}")
+        logger.info(f"Summary saved to: {summary_path}")
+        logger.info("=" * 60)
 
 
 def main():
     """Main function"""
+    # Plain console output; pool workers forward their records here through a queue
+    ensure_console_logging()
+    
     import argparse
     
     parser = argparse.ArgumentParser(description="Batch process PDF reports")
@@ -120,6 +219,10 @@ def main():
                        help="Input folder containing PDF files (default: current directory)")
     parser.add_argument("-o", "--output", default="output", 
                        help="Output folder for processed reports (default: output)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(),
+                       help="Number of worker processes (default: CPU count)")
+    parser.add_argument("-f", "--force", action="store_true",
+                       help="Reprocess PDFs even if their report is already up to date")
     
     args = parser.parse_args()
     
@@ -134,7 +237,7 @@ def main():
         return
     
     # Create processor and run
-    processor = BatchProcessor(args.input_folder, args.output)
+    processor = BatchProcessor(args.input_folder, args.output, args.workers, args.force)
     processor.process_all_files()
 
 
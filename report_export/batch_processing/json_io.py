@@ -0,0 +1,32 @@
+"""
+JSON Output Helpers
+==================
+
+Shared writer for the batch processing scripts. Uses orjson when it is
+installed (several times faster for large reports) and falls back to the
+standard library otherwise. Both paths produce UTF-8 with 2-space indentation,
+serialized to bytes up front and written to disk in one call.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj):
+    """Serialize obj to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json(obj, path):
+    """Write obj as indented UTF-8 JSON to path in a single write"""
+    Path(path).write_bytes(dumps_json(obj))
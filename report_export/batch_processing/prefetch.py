@@ -0,0 +1,38 @@
+"""
+PDF Read-Ahead
+==============
+
+Overlaps disk reads with parsing in the serial batch path. A background
+thread reads the next few PDFs so they are already in the OS page cache
+when the extractor opens them by path.
+"""
+
+import queue
+import threading
+
+READ_AHEAD = 2
+CHUNK_SIZE = 1 << 20
+
+
+def _warm(pdf_file):
+    """Read a file once and discard the data; errors are left to the extractor"""
+    try:
+        with open(pdf_file, "rb") as f:
+            while f.read(CHUNK_SIZE):
+                pass
+    except OSError:
+        pass
+
+
+def prefetched(pdf_files, read_ahead=READ_AHEAD):
+    """Yield pdf_files in order while the following files are read in the background"""
+    ready = queue.Queue(maxsize=read_ahead)
+
+    def reader():
+        for pdf_file in pdf_files:
+            _warm(pdf_file)
+            ready.put(pdf_file)
+
+    threading.Thread(target=reader, daemon=True).start()
+    for _ in range(len(pdf_files)):
+        yield ready.get()
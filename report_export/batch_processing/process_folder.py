@@ -8,23 +8,104 @@ in an output folder.
 
 import os
 import sys
-import json
+import logging
 from pathlib import Path
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__ and "." in __package__:
+    # python -m report_export.batch_processing.<script>
+    from ..extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+    from .json_io import dump_json
+    from .prefetch import prefetched
+    from .worker_logging import ensure_console_logging, start_log_listener, install_queue_handler
+else:
+    if not __package__:
+        # Run directly as a script: make report_export importable
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from extractors.layout_enhanced_extractor import LayoutEnhancedExtractor
+    from batch_processing.json_io import dump_json
+    from batch_processing.prefetch import prefetched
+    from batch_processing.worker_logging import ensure_console_logging, start_log_listener, install_queue_handler
+
+logger = logging.getLogger(__name__)
+
+# Per-process extractor, built once per worker and reused for every file
+_EXTRACTOR = None
+
+
+def _get_extractor():
+    """Return this process's extractor, creating it on first use"""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = LayoutEnhancedExtractor()
+    return _EXTRACTOR
 
 
-def process_folder(input_folder=".", output_folder="output"):
+def _init_worker(log_queue=None, log_level=logging.INFO):
+    """Pool initializer: route logging to the parent and build the extractor up front"""
+    if log_queue is not None:
+        install_queue_handler(log_queue, log_level)
+    _get_extractor()
+
+
+def _is_up_to_date(pdf_file, output_file):
+    """True if output_file exists and was written after pdf_file was last modified"""
+    try:
+        return os.stat(output_file).st_mtime > os.stat(pdf_file).st_mtime
+    except OSError:
+        return False
+
+
+def _process_file(pdf_file, output_file, extractor=None):
+    """
+    Process one PDF and save its report to output_file; returns the summary entry.
+    
+    Module-level so it can run in a worker process, which reuses its cached
+    extractor instead of receiving a pickled one.
+    """
+    pdf_name = os.path.basename(pdf_file)
+    try:
+        logger.info(f"Processing: {pdf_name}")
+        
+        if extractor is None:
+            extractor = _get_extractor()
+        
+        # Extract data
+        result = extractor.process_report(str(pdf_file))
+        
+        # Save results
+        dump_json(result, output_file)
+        
+        logger.info(f"✓ Saved: {output_file}")
+        return {
+            "file": pdf_name,
+            "status": "success",
+            "output": str(output_file)
+        }
+        
+    except Exception as e:
+        logger.error(f"✗ Error processing {pdf_name}: {e}")
+        return {
+            "file": pdf_name,
+            "status": "failed",
+            "error": str(e)
+        }
+
+
+def process_folder(input_folder=".", output_folder="output", workers=None, force=False):
     """
     Process all PDF files in a folder
     
     Args:
         input_folder: Folder containing PDF files (default: current directory)
         output_folder: Folder to save extracted reports (default: output)
+        workers: Number of worker processes (default: CPU count)
+        force: Reprocess PDFs whose report is already newer than the PDF
     """
     
+    # Progress goes to the console unless the caller configured logging
+    ensure_console_logging()
+    
     # Convert to Path objects
     input_path = Path(input_folder)
     output_path = Path(output_folder)
@@ -33,55 +114,63 @@ def process_folder(input_folder=".", output_folder="output"):
     output_path.mkdir(exist_ok=True)
     
     # Get all PDF files
-    pdf_files = list(input_path.glob("*.pdf"))
+    with os.scandir(input_path) as entries:
+        pdf_files = [Path(e.path) for e in entries
+                     if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".pdf")]
     
     if not pdf_files:
-        print(f"No PDF files found in: {input_path}")
+        logger.info(f"No PDF files found in: {input_path}")
         return
     
-    print(f"Found {len(pdf_files)} PDF files to process")
-    print(f"Input folder: {input_path}")
-    print(f"Output folder: {output_path}")
-    print("=" * 60)
-    
-    # Initialize extractor
-    extractor = LayoutEnhancedExtractor()
+    logger.info(f"Found {len(pdf_files)} PDF files to process")
+    logger.info(f"Input folder: {input_path}")
+    logger.info(f"Output folder: {output_path}")
+    logger.info("=" * 60)
+    
+    # Resolve every (input, output) pair up front; workers only receive plain strings
+    # (output name is the PDF name with an _extracted.json suffix)
+    inputs = [str(pdf_file) for pdf_file in pdf_files]
+    outputs = [str(output_path / (pdf_file.stem + "_extracted.json")) for pdf_file in pdf_files]
+    
+    # Reports newer than their PDF are kept as-is unless forced
+    todo = [i for i in range(len(pdf_files))
+            if force or not _is_up_to_date(inputs[i], outputs[i])]
+    todo_inputs = [inputs[i] for i in todo]
+    todo_outputs = [outputs[i] for i in todo]
+    skipped = len(pdf_files) - len(todo)
+    if skipped:
+        logger.info(f"Skipping {skipped} up-to-date file(s); use --force to reprocess")
+    
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    
+    if not todo:
+        done = []
+    elif workers <= 1:
+        # Initialize extractor
+        extractor = LayoutEnhancedExtractor()
+        # Read the next files from disk while the current one is parsed
+        done = [_process_file(src, dst, extractor) for src, dst in zip(prefetched(todo_inputs), todo_outputs)]
+    else:
+        # PDF parsing is CPU-bound, so spread files across processes
+        logger.info(f"Using {workers} worker processes")
+        # map keeps results in input order; chunking batches files per worker round trip
+        chunksize = max(1, len(todo) // (4 * workers))
+        # Workers queue their log records; one listener thread here writes them out
+        log_queue, listener = start_log_listener()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(log_queue, logging.getLogger().getEffectiveLevel())) as executor:
+                done = list(executor.map(_process_file, todo_inputs, todo_outputs, chunksize=chunksize))
+        finally:
+            listener.stop()
     
-    successful = 0
-    failed = 0
-    results = []
+    results = [{"file": pdf_file.name, "status": "skipped", "output": output}
+               for pdf_file, output in zip(pdf_files, outputs)]
+    for i, entry in zip(todo, done):
+        results[i] = entry
     
-    for pdf_file in pdf_files:
-        try:
-            print(f"Processing: {pdf_file.name}")
-            
-            # Extract data
-            result = extractor.process_report(str(pdf_file))
-            
-            # Create output filename (same name as PDF but with .json extension)
-            output_filename = pdf_file.stem + "_extracted.json"
-            output_file_path = output_path / output_filename
-            
-            # Save results
-            with open(output_file_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=4, ensure_ascii=False)
-            
-            print(f"✓ Saved: {output_file_path}")
-            successful += 1
-            results.append({
-                "file": pdf_file.name,
-                "status": "success",
-                "output": str(output_file_path)
-            })
-            
-        except Exception as e:
-            print(f"✗ Error processing {pdf_file.name}: {e}")
-            failed += 1
-            results.append({
-                "file": pdf_file.name,
-                "status": "failed",
-                "error": str(e)
-            })
+    successful = sum(1 for r in results if r["status"] == "success")
+    failed = sum(1 for r in results if r["status"] == "failed")
     
     # Save batch summary
     summary = {
@@ -89,6 +178,7 @@ def process_folder(input_folder=".", output_folder="output"):
             "total_files": len(pdf_files),
             "successful": successful,
             "failed": failed,
+            "skipped": skipped,
             "input_folder": str(input_path),
             "output_folder": str(output_path)
         },
@@ -96,33 +186,43 @@ def process_folder(input_folder=".", output_folder="output"):
     }
     
     summary_file = output_path / "batch_summary.json"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=4, ensure_ascii=False)
-    
-    print("\n" + "=" * 60)
-    print("FOLDER PROCESSING COMPLETED")
-    print("=" * 60)
-    print(f"Total files: {len(pdf_files)}")
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-    print(f"Summary saved to: {summary_file}")
-    print("=" * 60)
+    dump_json(summary, summary_file)
+    
+    logger.info("\n" + "=" * 60)
+    logger.info("FOLDER PROCESSING COMPLETED")
+    logger.info("=" * 60)
+    logger.info(f"Total files: {len(pdf_files)}")
+    logger.info(f"Successful: {successful}")
+    logger.info(f"Failed: {failed}")
+    logger.info(f"Skipped (up to date): {skipped}")
+    logger.info(f"Summary saved to: {summary_file}")
+    logger.info("=" * 60)
 
 
 def main():
     """Main function"""
+    # Plain console output; pool workers forward their records here through a queue
+    ensure_console_logging()
+    
+    # --force reprocesses PDFs whose report is already up to date
+    force = "--force" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    
     # Get input folder from command line or use current directory
-    if len(sys.argv) > 1:
-        input_folder = sys.argv[1]
+    if len(args) > 0:
+        input_folder = args[0]
     else:
         input_folder = "."  # Current directory
     
     # Get output folder from command line or use default
-    if len(sys.argv) > 2:
-        output_folder = sys.argv[2]
+    if len(args) > 1:
+        output_folder = args[1]
     else:
         output_folder = "output"
     
+    # Get worker count from command line or use CPU count
+    workers = int(args[2]) if len(args) > 2 else None
+    
     print("PDF Folder Processor")
     print("=" * 30)
     print(f"Input folder: {input_folder}")
@@ -132,7 +232,7 @@ def main():
     # Validate input folder
     if not os.path.exists(input_folder):
         print(f"Error: Input folder does not exist: {input_folder}")
-        print("Usage: py process_folder.py [input_folder] [output_folder]")
+        print("Usage: py process_folder.py [input_folder] [output_folder] [workers] [--force]")
         return
     
     if not os.path.isdir(input_folder):
@@ -140,7 +240,7 @@ def main():
         return
     
     # Process the folder
-    process_folder(input_folder, output_folder)
+    process_folder(input_folder, output_folder, workers, force)
 
 
 if __name__ == "__main__":
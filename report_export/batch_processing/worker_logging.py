@@ -0,0 +1,36 @@
+"""
+Worker Logging
+==============
+
+Funnels log records from batch worker processes back to the parent. Workers
+only put records on a queue; a single listener thread in the parent hands
+them to the parent's handlers, so workers never contend for stdout.
+
+The batch entry points print their progress to the console unless the
+application has configured logging itself.
+"""
+
+import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+
+
+def ensure_console_logging():
+    """Print INFO records as bare messages, unless the root logger already has handlers"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def start_log_listener():
+    """Start forwarding queued records to the root handlers; returns (queue, listener)"""
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+    return log_queue, listener
+
+
+def install_queue_handler(log_queue, level):
+    """Send this process's log records to log_queue instead of its own handlers"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
@@ -0,0 +1,69 @@
+"""
+Shared Result Cache
+===================
+
+On-disk cache helpers for enhanced_parser.py, final_extractor.py and the
+final_extractor-backup*.py variants. Entries are keyed by a hash of the
+PDF's bytes; all parsers share one directory, so each one names its entries
+with its own suffix or parser fingerprint.
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# REPORT_EXPORT_CACHE moves the cache; setting it to an empty string
+# disables caching
+CACHE_DIR = os.environ.get(
+    "REPORT_EXPORT_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "report_export")
+)
+
+
+def file_digest(path: str) -> str:
+    """blake2b hash of a file's contents, read in 1 MiB chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_fingerprint(module_file: str) -> str:
+    """
+    Short hash of a parser's source file and of the shared _shared_*.py
+    modules, for keying cached parse results: editing the parser invalidates
+    them while the cached text stays valid.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    return hashlib.blake2b("".join(
+        file_digest(path) for path in [module_file] + sorted(glob.glob(os.path.join(here, "_shared_*.py")))
+    ).encode(), digest_size=6).hexdigest()
+
+
+def cache_read(cache_dir: str, name: str) -> Optional[str]:
+    """Return a cache entry's contents, or None if it is missing"""
+    try:
+        with open(os.path.join(cache_dir, name), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def cache_write(cache_dir: str, name: str, content: str) -> None:
+    """Write a cache entry atomically (temp file + rename)"""
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, os.path.join(cache_dir, name))
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {name}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
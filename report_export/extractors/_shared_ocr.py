@@ -0,0 +1,92 @@
+"""
+Shared OCR Helpers
+==================
+
+Tesseract OCR of rendered page images for enhanced_parser.py and
+final_extractor-backup.py: pages are OCR'd in batches (one Tesseract run per
+batch), spread over worker processes on larger machines.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import pytesseract
+
+try:
+    # Optional in-process Tesseract binding; keeps the engine loaded between pages
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+
+OCR_BATCH_SIZE = 40  # longer image lists can hang pytesseract
+
+# Pages are rendered at OCR_FAST_DPI first (under half the pixels of 300 DPI)
+# and re-rendered at OCR_DPI only if that yields under OCR_MIN_CHARS_PER_PAGE
+OCR_FAST_DPI = 200
+OCR_DPI = 300
+OCR_MIN_CHARS_PER_PAGE = 200
+
+
+def ocr_batch(images) -> List[str]:
+    """
+    OCR several page images with a single Tesseract run.
+    
+    The images are written to a temporary directory and passed to Tesseract
+    as an image-list file, so the engine and language model load once per
+    batch instead of once per page. Falls back to per-page calls if the
+    output can't be split back into one text per page.
+    
+    Uses tesserocr's in-process API instead when it is installed.
+    
+    Module-level so pool workers can run it.
+    """
+    if PyTessBaseAPI is not None:
+        try:
+            texts = []
+            with PyTessBaseAPI(lang="eng") as api:
+                for image in images:
+                    api.SetImage(image)
+                    texts.append(api.GetUTF8Text())
+            return texts
+        except Exception as e:
+            print(f"tesserocr failed, falling back to pytesseract: {e}")
+    
+    if len(images) > 1:
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = []
+                for i, image in enumerate(images):
+                    path = os.path.join(tmp, f"page{i}.png")
+                    image.save(path)
+                    paths.append(path)
+                list_file = os.path.join(tmp, "images.txt")
+                with open(list_file, "w", encoding="utf-8") as f:
+                    f.write("\n".join(paths) + "\n")
+                # Tesseract ends every page with a form feed
+                texts = pytesseract.image_to_string(list_file).split("\f")
+            if texts and not texts[-1].strip():
+                texts.pop()
+            if len(texts) == len(images):
+                return texts
+        except Exception as e:
+            print(f"Batch OCR failed, falling back to per-page OCR: {e}")
+    return [pytesseract.image_to_string(image) for image in images]
+
+
+def ocr_pages(pages) -> List[str]:
+    """OCR rendered pages in batches, spread over worker processes on larger machines"""
+    cpus = os.cpu_count() or 1
+    # Tesseract already runs up to 4 threads per page, so use one process per 4 cores
+    workers = min(max(1, cpus // 4), len(pages))
+    # Batch pages per Tesseract run, with at least one batch per worker
+    size = min(OCR_BATCH_SIZE, max(1, -(-len(pages) // max(workers, 1))))
+    batches = [pages[i:i + size] for i in range(0, len(pages), size)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(ocr_batch, batches))
+    else:
+        results = [ocr_batch(batch) for batch in batches]
+    return [page_text for batch in results for page_text in batch]
@@ -0,0 +1,80 @@
+"""
+Shared Parser Patterns
+======================
+
+Precompiled regexes used by both enhanced_parser.py and
+final_extractor-backup.py. Compiled once per process at import, so neither
+parser goes through re's pattern cache. Room and coordinate patterns differ
+between the two parsers and stay in their own modules.
+"""
+
+import re
+
+# --- Metadata ---
+COMPANY_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",
+    r"Company\s*Name[:\-]?\s*(.+)",
+    r"Short\s*Cicuit\s*Company",
+))
+PROJECT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Project\s*Name|Lighting study.*?)\n",
+    r"Project\s*Name[:\-]?\s*(.+)",
+    r"Lighting\s*study\s*for\s*(.+)",
+))
+ENGINEER_RE = re.compile(r"Eng\.\s*[A-Za-z ]+")
+EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
+
+# Metadata fields and their patterns in priority order (email is found by find_email)
+META_FIELDS = (
+    ("company_name", COMPANY_RES),
+    ("project_name", PROJECT_RES),
+    ("engineer", (ENGINEER_RE,)),
+)
+# One alternation of every metadata pattern, each wrapped in a lookahead so
+# matches are zero-width and never hide one another
+META_SCAN_RE = re.compile("|".join(
+    f"(?=(?i:{p.pattern}))" if p.flags & re.IGNORECASE else f"(?={p.pattern})"
+    for _, patterns in META_FIELDS for p in patterns
+))
+
+# --- Lighting setup ---
+HIGHBAY_RE = re.compile(r"(\d+)\s*x\s*HighBay\s*(\d+)\s*watt", re.IGNORECASE)
+FIXTURES_RE = re.compile(r"(\d+)\s*fixtures?", re.IGNORECASE)
+AVG_LUX_RE = re.compile(r"Avr\.?lux\s*([\d.]+)", re.IGNORECASE)
+AVERAGE_LUX_RE = re.compile(r"average\s*lux[:\-]?\s*([\d.]+)", re.IGNORECASE)
+UNIFORMITY_RE = re.compile(r"Uniformity\s*([\d.]+)", re.IGNORECASE)
+UNIFORMITY_ALT_RE = re.compile(r"uniformity[:\-]?\s*([\d.]+)", re.IGNORECASE)
+POWER_RE = re.compile(r"([\d.]+)\s*W")
+TOTAL_POWER_RE = re.compile(r"total\s*power[:\-]?\s*([\d.]+)\s*W", re.IGNORECASE)
+EFFICACY_RE = re.compile(r"([\d.]+)\s*lm/W")
+EFFICACY_ALT_RE = re.compile(r"efficacy[:\-]?\s*([\d.]+)\s*lm/W", re.IGNORECASE)
+FIXTURE_DEFAULT = "HighBay 150 watt"  # used when the report gives no "N x HighBay W watt" line
+MOUNTING_HEIGHT_RE = re.compile(r"mounting\s*height[:\-]?\s*([\d.]+)\s*m", re.IGNORECASE)
+
+# --- Luminaires ---
+# Quantity must start a number, so a row that fails isn't retried from every
+# digit inside it. The article stays unbounded: a length cap makes long rows
+# match again from a later number, with the wrong quantity and manufacturer
+LUMINAIRE_RE = re.compile(r"(?<!\d)(\d+)\s+([A-Za-z]+)\s+([A-Za-z0-9\- ]+)\s+(\d+\.?\d*)\s*W\s+(\d+\.?\d*)\s*lm\s+(\d+\.?\d*)\s*lm/W")
+MANUFACTURER_RE = re.compile(r"manufacturer[:\-]?\s*([A-Za-z]+)", re.IGNORECASE)
+ARTICLE_NO_RE = re.compile(r"article\s*no[:\-]?\s*([A-Za-z0-9\- ]+)", re.IGNORECASE)
+LUM_POWER_RE = re.compile(r"(\d+\.?\d*)\s*W")
+LUM_FLUX_RE = re.compile(r"(\d+\.?\d*)\s*lm")
+LUM_EFFICACY_RE = re.compile(r"(\d+\.?\d*)\s*lm/W")
+QUANTITY_RE = re.compile(r"quantity[:\-]?\s*(\d+)", re.IGNORECASE)
+
+# --- Scenes ---
+# The name must start a run of letters/spaces: a failed attempt at the start of
+# a run can't succeed later in it, so this skips the quadratic retries
+SCENE_RE = re.compile(r"(?<![A-Za-z ])([A-Za-z ]+?)\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)")
+SCENE_NAME_RE = re.compile(r"scene\s*name[:\-]?\s*(.+)", re.IGNORECASE)
+MIN_LUX_RE = re.compile(r"min\s*lux[:\-]?\s*([\d.]+)", re.IGNORECASE)
+MAX_LUX_RE = re.compile(r"max\s*lux[:\-]?\s*([\d.]+)", re.IGNORECASE)
+
+# Single-match field patterns that the optional Hyperscan prefilter screens
+PREFILTERED_RES = (
+    HIGHBAY_RE, FIXTURES_RE, AVG_LUX_RE, AVERAGE_LUX_RE, UNIFORMITY_RE,
+    UNIFORMITY_ALT_RE, POWER_RE, TOTAL_POWER_RE, EFFICACY_RE, EFFICACY_ALT_RE,
+    MOUNTING_HEIGHT_RE, MANUFACTURER_RE, ARTICLE_NO_RE, LUM_POWER_RE, LUM_FLUX_RE,
+    LUM_EFFICACY_RE, QUANTITY_RE, MIN_LUX_RE, MAX_LUX_RE,
+)
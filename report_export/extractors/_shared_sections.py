@@ -0,0 +1,293 @@
+"""
+Shared Parser Sections
+======================
+
+Field extraction shared by enhanced_parser.py and final_extractor-backup.py.
+Each extract_* function fills one section of the report dict from the raw
+PDF text, using the patterns in _shared_patterns.py. Room extraction differs
+between the two parsers and stays in their own modules.
+"""
+
+import re
+from typing import Dict, Optional, Any, Sequence, Set
+
+if __package__:
+    from ._shared_patterns import (
+        EMAIL_RE, META_FIELDS, META_SCAN_RE, HIGHBAY_RE, FIXTURES_RE, AVG_LUX_RE,
+        AVERAGE_LUX_RE, UNIFORMITY_RE, UNIFORMITY_ALT_RE, POWER_RE, TOTAL_POWER_RE,
+        EFFICACY_RE, EFFICACY_ALT_RE, FIXTURE_DEFAULT, MOUNTING_HEIGHT_RE, LUMINAIRE_RE,
+        MANUFACTURER_RE, ARTICLE_NO_RE, LUM_POWER_RE, LUM_FLUX_RE, LUM_EFFICACY_RE,
+        QUANTITY_RE, SCENE_RE, SCENE_NAME_RE, MIN_LUX_RE, MAX_LUX_RE,
+        PREFILTERED_RES,
+    )
+else:
+    # Imported from a script run inside extractors/
+    from _shared_patterns import (
+        EMAIL_RE, META_FIELDS, META_SCAN_RE, HIGHBAY_RE, FIXTURES_RE, AVG_LUX_RE,
+        AVERAGE_LUX_RE, UNIFORMITY_RE, UNIFORMITY_ALT_RE, POWER_RE, TOTAL_POWER_RE,
+        EFFICACY_RE, EFFICACY_ALT_RE, FIXTURE_DEFAULT, MOUNTING_HEIGHT_RE, LUMINAIRE_RE,
+        MANUFACTURER_RE, ARTICLE_NO_RE, LUM_POWER_RE, LUM_FLUX_RE, LUM_EFFICACY_RE,
+        QUANTITY_RE, SCENE_RE, SCENE_NAME_RE, MIN_LUX_RE, MAX_LUX_RE,
+        PREFILTERED_RES,
+    )
+
+try:
+    # Optional multi-pattern engine; lets the sections skip fields that can't match
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+UTILISATION_PROFILE = "Health care premises - Operating areas (5.46.1 Pre-op and recovery rooms)"
+
+
+# --- Optional Hyperscan prefilter ---
+
+def build_prefilter(patterns: Sequence[re.Pattern]):
+    """Compile patterns into one Hyperscan database, or None without Hyperscan"""
+    if hyperscan is None:
+        return None
+    # PREFILTER may over-report but never misses a pattern that Python's re would match
+    base_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+                  | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[base_flags | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                   for p in patterns],
+        )
+        return db
+    except Exception as e:
+        print(f"Hyperscan prefilter unavailable, using plain regex searches: {e}")
+        return None
+
+
+_PREFILTER_DB = build_prefilter(PREFILTERED_RES)
+
+
+def candidate_patterns(text: str, db=_PREFILTER_DB,
+                       patterns: Sequence[re.Pattern] = PREFILTERED_RES) -> Optional[Set[re.Pattern]]:
+    """
+    Return the prefiltered patterns that can match text, from a single scan.
+
+    db is a database from build_prefilter(patterns); the default screens the
+    shared PREFILTERED_RES. None means there is no prefilter and every
+    pattern has to be searched.
+    """
+    if db is None:
+        return None
+    hits: Set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        hits.add(pattern_id)
+
+    db.scan(text.encode("utf-8"), match_event_handler=on_match)
+    return {patterns[i] for i in hits}
+
+
+def may_match(pattern: re.Pattern, candidates: Optional[Set[re.Pattern]]) -> bool:
+    """False only when the prefilter ruled the pattern out"""
+    return candidates is None or pattern in candidates
+
+
+def _search(pattern: re.Pattern, text: str, candidates: Optional[Set[re.Pattern]]) -> Optional[re.Match]:
+    """pattern.search(text), skipped when the prefilter ruled the pattern out"""
+    if not may_match(pattern, candidates):
+        return None
+    return pattern.search(text)
+
+
+# --- Metadata ---
+
+def find_email(text: str) -> Optional[str]:
+    """
+    Return the first EMAIL_RE match in text.
+
+    Only positions next to an '@' can match, so the text is scanned with
+    str.find and the regex runs just from the start of the word before each
+    '@' (str.isalnum() plus "_" is the same set as the regex word class).
+    """
+    at = text.find("@")
+    while at != -1:
+        start = at
+        while start > 0 and (text[start - 1].isalnum() or text[start - 1] in "_.-"):
+            start -= 1
+        match = EMAIL_RE.match(text, start) if start < at else None
+        if match:
+            return match.group(0).strip()
+        at = text.find("@", at + 1)
+    return None
+
+
+def scan_metadata(text: str) -> Dict[str, Optional[str]]:
+    """
+    Find all metadata fields in a single pass over the text.
+
+    META_SCAN_RE locates every position where some metadata pattern can
+    start; the individual patterns are then tried only at those positions.
+    Each field keeps the first hit of its highest-priority pattern, the same
+    result as searching the patterns one after another.
+    """
+    found = {field: [None] * len(patterns) for field, patterns in META_FIELDS}
+    pending = len(META_FIELDS)
+    for hit in META_SCAN_RE.finditer(text):
+        pos = hit.start()
+        for field, patterns in META_FIELDS:
+            slots = found[field]
+            if slots[0] is not None:
+                continue
+            for k, pattern in enumerate(patterns):
+                if slots[k] is None:
+                    slots[k] = pattern.match(text, pos)
+            if slots[0] is not None:
+                pending -= 1
+        if not pending:
+            break
+
+    metadata = {}
+    for field, slots in found.items():
+        match = next((m for m in slots if m is not None), None)
+        metadata[field] = match.group(0).strip() if match else None
+    metadata["email"] = find_email(text)
+    return metadata
+
+
+def extract_metadata(text: str, data: Dict[str, Any]) -> None:
+    """Company, project, engineer and email from one scan of the text"""
+    data["metadata"].update(scan_metadata(text))
+
+
+# --- Lighting setup ---
+
+def extract_lighting_setup(text: str, data: Dict[str, Any],
+                           candidates: Optional[Set[re.Pattern]] = None) -> None:
+    """Fill data["lighting_setup"]; candidates comes from candidate_patterns()"""
+    # Number of fixtures and type
+    number_of_fixtures = None
+    fixture_type = FIXTURE_DEFAULT
+    num_fix = _search(HIGHBAY_RE, text, candidates)
+    if num_fix:
+        number_of_fixtures = int(num_fix.group(1))
+        fixture_type = f"HighBay {num_fix.group(2)} watt"
+    else:
+        # Alternative pattern (count only; the type keeps the default)
+        num_fix = _search(FIXTURES_RE, text, candidates)
+        if num_fix:
+            number_of_fixtures = int(num_fix.group(1))
+
+    # Average lux
+    avg_lux = _search(AVG_LUX_RE, text, candidates)
+    if not avg_lux:
+        avg_lux = _search(AVERAGE_LUX_RE, text, candidates)
+
+    # Uniformity
+    uniformity = _search(UNIFORMITY_RE, text, candidates)
+    if not uniformity:
+        uniformity = _search(UNIFORMITY_ALT_RE, text, candidates)
+
+    # Total power
+    total_power = _search(POWER_RE, text, candidates)
+    if not total_power:
+        total_power = _search(TOTAL_POWER_RE, text, candidates)
+
+    # Efficacy
+    efficacy = _search(EFFICACY_RE, text, candidates)
+    if not efficacy:
+        efficacy = _search(EFFICACY_ALT_RE, text, candidates)
+
+    # Mounting height
+    mounting_height = _search(MOUNTING_HEIGHT_RE, text, candidates)
+
+    data["lighting_setup"] = {
+        "number_of_fixtures": number_of_fixtures,
+        "fixture_type": fixture_type,
+        "mounting_height_m": float(mounting_height.group(1)) if mounting_height else None,
+        "average_lux": float(avg_lux.group(1)) if avg_lux else None,
+        "uniformity": float(uniformity.group(1)) if uniformity else None,
+        "total_power_w": float(total_power.group(1)) if total_power else None,
+        "luminous_efficacy_lm_per_w": float(efficacy.group(1)) if efficacy else None,
+    }
+
+
+# --- Luminaires ---
+
+def extract_luminaires(text: str, data: Dict[str, Any],
+                       candidates: Optional[Set[re.Pattern]] = None) -> None:
+    """Append luminaire rows to data["luminaires"]"""
+    # Primary pattern from added.txt
+    luminaire_matches = LUMINAIRE_RE.findall(text)
+
+    # Alternative patterns if primary doesn't match
+    if not luminaire_matches:
+        # Look for manufacturer and specs separately
+        manufacturer = _search(MANUFACTURER_RE, text, candidates)
+        article_no = _search(ARTICLE_NO_RE, text, candidates)
+        power = _search(LUM_POWER_RE, text, candidates)
+        flux = _search(LUM_FLUX_RE, text, candidates)
+        efficacy_lum = _search(LUM_EFFICACY_RE, text, candidates)
+        quantity = _search(QUANTITY_RE, text, candidates)
+
+        if manufacturer or power:
+            luminaire_matches = [(
+                quantity.group(1) if quantity else "1",
+                manufacturer.group(1) if manufacturer else "Unknown",
+                article_no.group(1) if article_no else "Unknown",
+                power.group(1) if power else "0",
+                flux.group(1) if flux else "0",
+                efficacy_lum.group(1) if efficacy_lum else "0"
+            )]
+
+    for match in luminaire_matches:
+        data["luminaires"].append({
+            "quantity": int(match[0]),
+            "manufacturer": match[1],
+            "article_no": match[2],
+            "power_w": float(match[3]),
+            "luminous_flux_lm": float(match[4]),
+            "efficacy_lm_per_w": float(match[5])
+        })
+
+
+# --- Scenes ---
+
+def extract_scenes(text: str, data: Dict[str, Any],
+                   candidates: Optional[Set[re.Pattern]] = None) -> None:
+    """Append scene metrics to data["scenes"]"""
+    # Primary pattern from added.txt
+    scene_matches = SCENE_RE.findall(text)
+
+    # Alternative patterns if primary doesn't match
+    if not scene_matches:
+        # Look for scene names and metrics separately
+        scene_names = SCENE_NAME_RE.findall(text)
+        if not scene_names:
+            scene_names = ["the factory", "working place"]  # Default scene names
+
+        for scene_name in scene_names:
+            scene_name = scene_name.strip()
+            # Look for lux values near this scene
+            avg_lux_scene = _search(AVERAGE_LUX_RE, text, candidates)
+            min_lux_scene = _search(MIN_LUX_RE, text, candidates)
+            max_lux_scene = _search(MAX_LUX_RE, text, candidates)
+            uniformity_scene = _search(UNIFORMITY_ALT_RE, text, candidates)
+
+            data["scenes"].append({
+                "scene_name": scene_name,
+                "average_lux": float(avg_lux_scene.group(1)) if avg_lux_scene else None,
+                "min_lux": float(min_lux_scene.group(1)) if min_lux_scene else None,
+                "max_lux": float(max_lux_scene.group(1)) if max_lux_scene else None,
+                "uniformity": float(uniformity_scene.group(1)) if uniformity_scene else None,
+                "utilisation_profile": UTILISATION_PROFILE
+            })
+    else:
+        for sm in scene_matches:
+            data["scenes"].append({
+                "scene_name": sm[0].strip(),
+                "average_lux": float(sm[1]),
+                "min_lux": float(sm[2]),
+                "max_lux": float(sm[3]),
+                "uniformity": float(sm[4]),
+                "utilisation_profile": UTILISATION_PROFILE
+            })
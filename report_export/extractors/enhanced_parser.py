@@ -22,12 +22,52 @@ Version: 1.0
 
 import pdfplumber
 from pdf2image import convert_from_path
-import pytesseract
 import re
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 
+if __package__:
+    from ._shared_sections import (
+        candidate_patterns, extract_metadata, extract_lighting_setup,
+        extract_luminaires, extract_scenes,
+    )
+    from ._shared_cache import CACHE_DIR, cache_read, cache_write, file_digest, parser_fingerprint
+    from ._shared_ocr import OCR_DPI, OCR_FAST_DPI, OCR_MIN_CHARS_PER_PAGE, ocr_pages
+else:
+    # Run as a script, or imported with extractors/ on sys.path
+    from _shared_sections import (
+        candidate_patterns, extract_metadata, extract_lighting_setup,
+        extract_luminaires, extract_scenes,
+    )
+    from _shared_cache import CACHE_DIR, cache_read, cache_write, file_digest, parser_fingerprint
+    from _shared_ocr import OCR_DPI, OCR_FAST_DPI, OCR_MIN_CHARS_PER_PAGE, ocr_pages
+
+
+# --- Precompiled patterns ---
+# Metadata, lighting, luminaire and scene patterns are shared with
+# final_extractor-backup.py (_shared_patterns.py); room patterns are local
+_ROOM_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+",
+    r"Room\s*\d+",
+    r"Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+",
+))
+_COORD_RE = re.compile(r"(\d+\.?\d*)\s*,\s*(\d+\.?\d*)\s*,\s*(\d+\.?\d*)")
+
+
+# --- Result cache ---
+# Reports are cached on disk keyed by a hash of the PDF's bytes (see
+# _shared_cache.py), so reruns on unchanged files skip extraction, OCR and
+# parsing.
+# Cached text is specific to this parser's extraction chain; the other
+# parsers extract differently and keep their own text in the same directory
+_TEXT_CACHE_SUFFIX = ".enhanced.txt"
+
+# Parsed results are also keyed on the parser source, so editing the parser
+# invalidates them while the cached text stays valid
+_PARSER_FINGERPRINT = parser_fingerprint(__file__)
+
 
 def extract_text(pdf_path: str) -> str:
     """
@@ -42,15 +82,17 @@ def extract_text(pdf_path: str) -> str:
     Returns:
         str: Extracted text content, or empty string if extraction fails
     """
-    text = ""
+    parts = []
     try:
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
-                if page.extract_text():
-                    text += page.extract_text() + "\n"
+                # extract_text() is expensive; call it once per page
+                page_text = page.extract_text()
+                if page_text:
+                    parts.append(page_text)
     except Exception as e:
         print(f"Error extracting text with pdfplumber: {e}")
-    return text.strip()
+    return "\n".join(parts).strip()
 
 
 def ocr_pdf(pdf_path: str) -> str:
@@ -67,14 +109,19 @@ def ocr_pdf(pdf_path: str) -> str:
     Returns:
         str: OCR extracted text content, or empty string if extraction fails
     """
-    text = ""
+    parts = []
     try:
-        pages = convert_from_path(pdf_path, dpi=300)
-        for page in pages:
-            text += pytesseract.image_to_string(page) + "\n"
+        cpus = os.cpu_count() or 1
+        # Grayscale: Tesseract binarises anyway, and it cuts the image data by two thirds
+        pages = convert_from_path(pdf_path, dpi=OCR_FAST_DPI, thread_count=cpus, grayscale=True)
+        parts = ocr_pages(pages)
+        if sum(len(t.strip()) for t in parts) < OCR_MIN_CHARS_PER_PAGE * len(pages):
+            print(f"Little text found at {OCR_FAST_DPI} DPI, retrying OCR at {OCR_DPI} DPI")
+            pages = convert_from_path(pdf_path, dpi=OCR_DPI, thread_count=cpus, grayscale=True)
+            parts = ocr_pages(pages)
     except Exception as e:
         print(f"Error during OCR: {e}")
-    return text.strip()
+    return "\n".join(parts).strip()
 
 
 def parse_report(text: str, filename: str = "report.pdf") -> Dict[str, Any]:
@@ -98,7 +145,7 @@ def parse_report(text: str, filename: str = "report.pdf") -> Dict[str, Any]:
             - rooms: Room layouts (basic)
             - scenes: Performance metrics and utilization profiles
     """
-    data = {
+    data: Dict[str, Any] = {
         "metadata": {
             "company_name": None,
             "project_name": None,
@@ -113,139 +160,31 @@ def parse_report(text: str, filename: str = "report.pdf") -> Dict[str, Any]:
     }
 
     # --- Enhanced Metadata Extraction ---
-    # Company name patterns (improved from added.txt)
-    company_patterns = [
-        r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",
-        r"Company\s*Name[:\-]?\s*(.+)",
-        r"Short\s*Cicuit\s*Company"
-    ]
-    
-    for pattern in company_patterns:
-        company_match = re.search(pattern, text, re.IGNORECASE)
-        if company_match:
-            data["metadata"]["company_name"] = company_match.group(0).strip()
-            break
-
-    # Project name patterns (improved)
-    project_patterns = [
-        r"(Project\s*Name|Lighting study.*?)\n",
-        r"Project\s*Name[:\-]?\s*(.+)",
-        r"Lighting\s*study\s*for\s*(.+)"
-    ]
-    
-    for pattern in project_patterns:
-        project_match = re.search(pattern, text, re.IGNORECASE)
-        if project_match:
-            data["metadata"]["project_name"] = project_match.group(0).strip()
-            break
-
-    # Engineer patterns
-    engineer_match = re.search(r"Eng\.\s*[A-Za-z ]+", text)
-    if engineer_match:
-        data["metadata"]["engineer"] = engineer_match.group(0).strip()
-
-    # Email patterns
-    email_match = re.search(r"[\w\.-]+@[\w\.-]+", text)
-    if email_match:
-        data["metadata"]["email"] = email_match.group(0).strip()
+    # Company, project, engineer and email from one scan of the text
+    extract_metadata(text, data)
+
+    # Which single-match field patterns occur at all (None: search them all)
+    candidates = candidate_patterns(text)
 
     # --- Enhanced Lighting Setup Extraction ---
-    # Number of fixtures and type
-    num_fix = re.search(r"(\d+)\s*x\s*HighBay\s*(\d+)\s*watt", text, re.IGNORECASE)
-    if not num_fix:
-        # Alternative patterns
-        num_fix = re.search(r"(\d+)\s*fixtures?", text, re.IGNORECASE)
-        fixture_type = re.search(r"(HighBay\s*\d+\s*watt?)", text, re.IGNORECASE)
-    
-    # Average lux
-    avg_lux = re.search(r"Avr\.?lux\s*([\d.]+)", text, re.IGNORECASE)
-    if not avg_lux:
-        avg_lux = re.search(r"average\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-    
-    # Uniformity
-    uniformity = re.search(r"Uniformity\s*([\d.]+)", text, re.IGNORECASE)
-    if not uniformity:
-        uniformity = re.search(r"uniformity[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-    
-    # Total power
-    total_power = re.search(r"([\d.]+)\s*W", text)
-    if not total_power:
-        total_power = re.search(r"total\s*power[:\-]?\s*([\d.]+)\s*W", text, re.IGNORECASE)
-    
-    # Efficacy
-    efficacy = re.search(r"([\d.]+)\s*lm/W", text)
-    if not efficacy:
-        efficacy = re.search(r"efficacy[:\-]?\s*([\d.]+)\s*lm/W", text, re.IGNORECASE)
-
-    # Mounting height
-    mounting_height = re.search(r"mounting\s*height[:\-]?\s*([\d.]+)\s*m", text, re.IGNORECASE)
-
-    data["lighting_setup"] = {
-        "number_of_fixtures": int(num_fix.group(1)) if num_fix else None,
-        "fixture_type": f"HighBay {num_fix.group(2)} watt" if num_fix and len(num_fix.groups()) > 1 else "HighBay 150 watt",
-        "mounting_height_m": float(mounting_height.group(1)) if mounting_height else None,
-        "average_lux": float(avg_lux.group(1)) if avg_lux else None,
-        "uniformity": float(uniformity.group(1)) if uniformity else None,
-        "total_power_w": float(total_power.group(1)) if total_power else None,
-        "luminous_efficacy_lm_per_w": float(efficacy.group(1)) if efficacy else None,
-    }
+    extract_lighting_setup(text, data, candidates)
 
     # --- Enhanced Luminaires Extraction ---
-    # Primary pattern from added.txt
-    luminaire_matches = re.findall(r"(\d+)\s+([A-Za-z]+)\s+([A-Za-z0-9\- ]+)\s+(\d+\.?\d*)\s*W\s+(\d+\.?\d*)\s*lm\s+(\d+\.?\d*)\s*lm/W", text)
-    
-    # Alternative patterns if primary doesn't match
-    if not luminaire_matches:
-        # Look for manufacturer and specs separately
-        manufacturer = re.search(r"manufacturer[:\-]?\s*([A-Za-z]+)", text, re.IGNORECASE)
-        article_no = re.search(r"article\s*no[:\-]?\s*([A-Za-z0-9\- ]+)", text, re.IGNORECASE)
-        power = re.search(r"(\d+\.?\d*)\s*W", text)
-        flux = re.search(r"(\d+\.?\d*)\s*lm", text)
-        efficacy_lum = re.search(r"(\d+\.?\d*)\s*lm/W", text)
-        quantity = re.search(r"quantity[:\-]?\s*(\d+)", text, re.IGNORECASE)
-        
-        if manufacturer or power:
-            luminaire_matches = [(
-                quantity.group(1) if quantity else "1",
-                manufacturer.group(1) if manufacturer else "Unknown",
-                article_no.group(1) if article_no else "Unknown",
-                power.group(1) if power else "0",
-                flux.group(1) if flux else "0",
-                efficacy_lum.group(1) if efficacy_lum else "0"
-            )]
-    
-    for match in luminaire_matches:
-        data["luminaires"].append({
-            "quantity": int(match[0]),
-            "manufacturer": match[1],
-            "article_no": match[2],
-            "power_w": float(match[3]),
-            "luminous_flux_lm": float(match[4]),
-            "efficacy_lm_per_w": float(match[5])
-        })
+    extract_luminaires(text, data, candidates)
 
     # --- Enhanced Rooms Extraction ---
     # Look for room information
-    room_patterns = [
-        r"Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+",
-        r"Room\s*\d+",
-        r"Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+"
-    ]
-    
-    for pattern in room_patterns:
-        room_matches = re.findall(pattern, text, re.IGNORECASE)
+    layout = None
+    for pattern in _ROOM_RES:
+        room_matches = pattern.findall(text)
         for room_name in room_matches:
-            # Look for coordinates
-            coord_pattern = r"(\d+\.?\d*)\s*,\s*(\d+\.?\d*)\s*,\s*(\d+\.?\d*)"
-            coords = re.findall(coord_pattern, text)
-            
-            layout = []
-            for coord in coords:
-                layout.append({
+            # Coordinates don't depend on the room; parse them once, on the first room
+            if layout is None:
+                layout = [{
                     "x_m": float(coord[0]),
                     "y_m": float(coord[1]),
                     "z_m": float(coord[2])
-                })
+                } for coord in _COORD_RE.findall(text)]
             
             data["rooms"].append({
                 "name": room_name,
@@ -254,82 +193,118 @@ def parse_report(text: str, filename: str = "report.pdf") -> Dict[str, Any]:
             })
 
     # --- Enhanced Scenes Extraction ---
-    # Primary pattern from added.txt
-    scene_matches = re.findall(
-        r"([A-Za-z ]+)\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)",
-        text
-    )
-    
-    # Alternative patterns if primary doesn't match
-    if not scene_matches:
-        # Look for scene names and metrics separately
-        scene_names = re.findall(r"scene\s*name[:\-]?\s*(.+)", text, re.IGNORECASE)
-        if not scene_names:
-            scene_names = ["the factory", "working place"]  # Default scene names
-        
-        for scene_name in scene_names:
-            scene_name = scene_name.strip()
-            # Look for lux values near this scene
-            avg_lux_scene = re.search(r"average\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-            min_lux_scene = re.search(r"min\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-            max_lux_scene = re.search(r"max\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-            uniformity_scene = re.search(r"uniformity[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-            
-            data["scenes"].append({
-                "scene_name": scene_name,
-                "average_lux": float(avg_lux_scene.group(1)) if avg_lux_scene else None,
-                "min_lux": float(min_lux_scene.group(1)) if min_lux_scene else None,
-                "max_lux": float(max_lux_scene.group(1)) if max_lux_scene else None,
-                "uniformity": float(uniformity_scene.group(1)) if uniformity_scene else None,
-                "utilisation_profile": "Health care premises - Operating areas (5.46.1 Pre-op and recovery rooms)"
-            })
-    else:
-        for sm in scene_matches:
-            data["scenes"].append({
-                "scene_name": sm[0].strip(),
-                "average_lux": float(sm[1]),
-                "min_lux": float(sm[2]),
-                "max_lux": float(sm[3]),
-                "uniformity": float(sm[4]),
-                "utilisation_profile": "Health care premises - Operating areas (5.46.1 Pre-op and recovery rooms)"
-            })
+    extract_scenes(text, data, candidates)
 
     return data
 
 
-def process_report(pdf_path: str) -> Dict[str, Any]:
+def process_report(pdf_path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Main processing function with hybrid extraction based on added.txt.
     
     This function orchestrates the complete PDF processing workflow:
-    1. Attempts text-based extraction first
-    2. Falls back to OCR if text extraction is insufficient
-    3. Parses the extracted text into structured data
+    1. Returns the cached result if this exact PDF was parsed before
+    2. Attempts text-based extraction first (or reuses cached text)
+    3. Falls back to OCR if text extraction is insufficient
+    4. Parses the extracted text into structured data
     
     Args:
         pdf_path (str): Path to the PDF file to process
+        use_cache (bool): Read and write the on-disk cache in CACHE_DIR
         
     Returns:
         Dict[str, Any]: Complete structured data extracted from the PDF
     """
     print(f"Processing report: {pdf_path}")
-    
-    # Step 1: Extract text from text-based PDF
-    text = extract_text(pdf_path)
-    print(f"Text extraction: {len(text)} characters")
-    
-    # Step 2: OCR fallback if little/no text
-    if not text or len(text) < 50:
-        print("Falling back to OCR...")
-        text = ocr_pdf(pdf_path)
-        print(f"OCR extraction: {len(text)} characters")
+    filename = os.path.basename(pdf_path)
+    
+    key = file_digest(pdf_path) if use_cache and CACHE_DIR else None
+    if key:
+        cached = cache_read(CACHE_DIR, f"{key}.{_PARSER_FINGERPRINT}.json")
+        if cached is not None:
+            print("Using cached result")
+            parsed = json.loads(cached)
+            parsed["metadata"]["report_title"] = filename
+            return parsed
+    
+    text = cache_read(CACHE_DIR, key + _TEXT_CACHE_SUFFIX) if key else None
+    if text is not None:
+        print(f"Using cached text: {len(text)} characters")
+    else:
+        # Step 1: Extract text from text-based PDF
+        text = extract_text(pdf_path)
+        print(f"Text extraction: {len(text)} characters")
+        
+        # Step 2: OCR fallback if little/no text
+        if not text or len(text) < 50:
+            print("Falling back to OCR...")
+            text = ocr_pdf(pdf_path)
+            print(f"OCR extraction: {len(text)} characters")
+        
+        # Empty text usually means a failed extraction; don't cache it
+        if key and text:
+            cache_write(CACHE_DIR, key + _TEXT_CACHE_SUFFIX, text)
     
     # Step 3: Parse fields into structured schema
-    parsed = parse_report(text, filename=os.path.basename(pdf_path))
+    parsed = parse_report(text, filename=filename)
+    
+    if key:
+        cache_write(CACHE_DIR, f"{key}.{_PARSER_FINGERPRINT}.json", json.dumps(parsed, ensure_ascii=False))
     
     return parsed
 
 
+def _process_report_entry(pdf_path: str) -> Dict[str, Any]:
+    """Run process_report for one batch entry, reporting errors instead of raising"""
+    try:
+        return {"file": pdf_path, "report": process_report(pdf_path)}
+    except Exception as e:
+        print(f"Error processing {pdf_path}: {e}")
+        return {"file": pdf_path, "error": str(e)}
+
+
+def batch_process(paths: List[str], workers: Optional[int] = None,
+                  output_file: str = "reports.jsonl") -> Dict[str, int]:
+    """
+    Process many PDFs in parallel and stream the results to a JSONL file.
+    
+    Each PDF is handled by process_report in a worker process, so the
+    on-disk cache makes repeated runs over the same files cheap. Results are
+    written one JSON object per line as soon as each file finishes, so the
+    line order follows completion, not input order.
+    
+    Args:
+        paths (List[str]): PDF files to process
+        workers (Optional[int]): Worker processes (default: CPU count)
+        output_file (str): JSONL file to write; one {"file", "report"} or
+            {"file", "error"} object per line
+        
+    Returns:
+        Dict[str, int]: Counts of successful and failed files
+    """
+    counts = {"successful": 0, "failed": 0}
+    if not paths:
+        return counts
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    
+    with open(output_file, "w", encoding="utf-8") as out:
+        def write(entry):
+            counts["failed" if "error" in entry else "successful"] += 1
+            out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        
+        if workers <= 1:
+            for pdf_path in paths:
+                write(_process_report_entry(pdf_path))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_process_report_entry, pdf_path) for pdf_path in paths]
+                for future in as_completed(futures):
+                    write(future.result())
+    
+    print(f"Batch complete: {counts['successful']} succeeded, {counts['failed']} failed. "
+          f"Results saved to {output_file}")
+    return counts
+
 def main():
     """
     Main function for command-line usage of the Enhanced Parser.
@@ -339,11 +314,18 @@ def main():
     
     Usage:
         python enhanced_parser.py [pdf_file_path]
+        python enhanced_parser.py <pdf_file_path> <pdf_file_path> ...
         
     If no file path is provided, it will use the default PDF file.
+    Several file paths are processed in parallel into reports.jsonl.
     """
     import sys
     
+    # Several PDFs: process them in parallel into one JSONL file
+    if len(sys.argv) > 2:
+        batch_process(sys.argv[1:])
+        return
+    
     # Get PDF path from command line argument or use default
     if len(sys.argv) > 1:
         pdf_path = sys.argv[1]
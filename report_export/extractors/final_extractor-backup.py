@@ -8,58 +8,165 @@ for maximum compatibility and extraction accuracy.
 
 import pdfplumber
 from pdf2image import convert_from_path
-import pytesseract
 import re
 import json
 import os
-from typing import Dict, List, Optional, Any
+import sys
+from typing import Dict, List, Any
+
+try:
+    # Optional: vectorised coordinate parsing
+    import numpy as np
+except ImportError:
+    np = None
+
+# Parsing sections are shared with enhanced_parser.py. This file's name isn't
+# a valid module name, so it is never part of the package; import the shared
+# code from its own directory
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+from _shared_sections import (
+    extract_metadata, extract_lighting_setup, extract_luminaires, extract_scenes,
+)
+from _shared_cache import CACHE_DIR, cache_read, cache_write, file_digest, parser_fingerprint
+from _shared_ocr import OCR_DPI, OCR_FAST_DPI, OCR_MIN_CHARS_PER_PAGE, ocr_pages
+
+
+# --- Precompiled patterns ---
+# Metadata, lighting, luminaire and scene patterns are shared with
+# enhanced_parser.py (_shared_patterns.py); room and layout patterns are local
+
+# Room name patterns
+_ROOM_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",
+    r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",
+    r"(Room\s*\d+)",
+    r"(Building\s*\d+.*?Room\s*\d+)",
+))
+_ROOM_LIKE_RE = re.compile(r"([A-Za-z\s]+\d+[A-Za-z\s]*\d*)")
+# Coordinate patterns - multiple formats
+_COORD_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m",  # "4.000 m 36.002 m 7.000 m"
+    r"(\d+\.?\d*)\s*,\s*(\d+\.?\d*)\s*,\s*(\d+\.?\d*)",      # "4.000, 36.002, 7.000"
+    r"(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)",              # "4.000 36.002 7.000"
+    r"X[:\-]?\s*(\d+\.?\d*)\s*Y[:\-]?\s*(\d+\.?\d*)\s*Z[:\-]?\s*(\d+\.?\d*)",  # "X: 4.000 Y: 36.002 Z: 7.000"
+    r"(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm",  # "4000.000 mm 36002.000 mm 7000.000 mm"
+))
+# Arrangement patterns
+_ARRANGEMENT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",
+    r"Layout[:\-]?\s*([A-Za-z0-9]+)",
+    r"Pattern[:\-]?\s*([A-Za-z0-9]+)",
+    r"([A-Za-z0-9]+)\s*arrangement",
+))
+
+# --- Result cache ---
+# Reports are cached on disk keyed by a hash of the PDF's bytes (see
+# _shared_cache.py), so reruns on unchanged files skip extraction, OCR and
+# parsing.
+# Cached text is specific to this parser's extraction chain; the other
+# parsers extract differently and keep their own text in the same directory
+_TEXT_CACHE_SUFFIX = ".backup.txt"
+
+# Parsed results are also keyed on the parser source, so editing the parser
+# invalidates them while the cached text stays valid
+_PARSER_FINGERPRINT = parser_fingerprint(__file__)
+
+
+# A text layer with fewer than SCAN_PROBE_MIN_CHARS characters on the first
+# SCAN_PROBE_PAGES pages is treated as a scanned PDF: the text extractors stop
+# there instead of walking every page before the OCR fallback
+SCAN_PROBE_PAGES = 4
+SCAN_PROBE_MIN_CHARS = 20
+
+
+def _parse_points(raw, in_mm) -> List[tuple]:
+    """
+    Convert coordinate string triples to (x, y, z) floats in metres.
+    
+    With NumPy installed the whole batch is parsed and scaled in one
+    vectorised step; otherwise it falls back to a plain float() loop.
+    """
+    if np is not None and raw:
+        points = np.array(raw, dtype=np.float64)
+        points[np.array(in_mm, dtype=bool)] /= 1000
+        return [tuple(p) for p in points.tolist()]
+    
+    points = []
+    for (x, y, z), mm in zip(raw, in_mm):
+        x, y, z = float(x), float(y), float(z)
+        if mm:
+            x, y, z = x/1000, y/1000, z/1000
+        points.append((x, y, z))
+    return points
 
 
 class FinalPDFExtractor:
     """Final PDF extractor combining all approaches"""
     
     def __init__(self):
+        # PyMuPDF is much faster than pdfplumber (pdfminer) for plain text,
+        # so it goes first; pdfplumber remains the fallback
         self.text_extractors = [
-            self._extract_with_pdfplumber,
-            self._extract_with_pymupdf
+            self._extract_with_pymupdf,
+            self._extract_with_pdfplumber
         ]
     
     def _extract_with_pdfplumber(self, pdf_path: str) -> str:
         """Extract text using pdfplumber"""
-        text = ""
+        parts = []
+        chars = 0
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    if page.extract_text():
-                        text += page.extract_text() + "\n"
+                for page_num, page in enumerate(pdf.pages, 1):
+                    # extract_text() is expensive; call it once per page
+                    page_text = page.extract_text()
+                    if page_text:
+                        parts.append(page_text)
+                        chars += len(page_text)
+                    if page_num == SCAN_PROBE_PAGES and chars < SCAN_PROBE_MIN_CHARS:
+                        break  # no usable text layer
         except Exception as e:
             print(f"pdfplumber error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def _extract_with_pymupdf(self, pdf_path: str) -> str:
         """Extract text using PyMuPDF"""
-        text = ""
+        parts = []
+        chars = 0
         try:
             import fitz
             doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text() + "\n"
-            doc.close()
+            try:
+                for page_num in range(len(doc)):
+                    # Plain text in stream order; no layout sorting
+                    page_text = doc.load_page(page_num).get_text("text", sort=False)
+                    parts.append(page_text)
+                    chars += len(page_text.strip())
+                    if page_num + 1 == SCAN_PROBE_PAGES and chars < SCAN_PROBE_MIN_CHARS:
+                        break  # no usable text layer
+            finally:
+                doc.close()
         except Exception as e:
             print(f"PyMuPDF error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def _ocr_pdf(self, pdf_path: str) -> str:
         """OCR fallback for scanned PDFs"""
-        text = ""
+        parts = []
         try:
-            pages = convert_from_path(pdf_path, dpi=300)
-            for page in pages:
-                text += pytesseract.image_to_string(page) + "\n"
+            cpus = os.cpu_count() or 1
+            # Grayscale: Tesseract binarises anyway, and it cuts the image data by two thirds
+            pages = convert_from_path(pdf_path, dpi=OCR_FAST_DPI, thread_count=cpus, grayscale=True)
+            parts = ocr_pages(pages)
+            if sum(len(t.strip()) for t in parts) < OCR_MIN_CHARS_PER_PAGE * len(pages):
+                print(f"Little text found at {OCR_FAST_DPI} DPI, retrying OCR at {OCR_DPI} DPI")
+                pages = convert_from_path(pdf_path, dpi=OCR_DPI, thread_count=cpus, grayscale=True)
+                parts = ocr_pages(pages)
         except Exception as e:
             print(f"OCR error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def extract_text(self, pdf_path: str) -> str:
         """Extract text with fallback chain"""
@@ -99,177 +206,55 @@ class FinalPDFExtractor:
     
     def _extract_metadata(self, text: str, data: Dict[str, Any]):
         """Extract metadata fields"""
-        # Company name
-        company_patterns = [
-            r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",
-            r"Company\s*Name[:\-]?\s*(.+)",
-            r"Short\s*Cicuit\s*Company"
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data["metadata"]["company_name"] = match.group(0).strip()
-                break
-
-        # Project name
-        project_patterns = [
-            r"(Project\s*Name|Lighting study.*?)\n",
-            r"Project\s*Name[:\-]?\s*(.+)",
-            r"Lighting\s*study\s*for\s*(.+)"
-        ]
-        
-        for pattern in project_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data["metadata"]["project_name"] = match.group(0).strip()
-                break
-
-        # Engineer
-        engineer_match = re.search(r"Eng\.\s*[A-Za-z ]+", text)
-        if engineer_match:
-            data["metadata"]["engineer"] = engineer_match.group(0).strip()
-
-        # Email
-        email_match = re.search(r"[\w\.-]+@[\w\.-]+", text)
-        if email_match:
-            data["metadata"]["email"] = email_match.group(0).strip()
+        extract_metadata(text, data)
     
     def _extract_lighting_setup(self, text: str, data: Dict[str, Any]):
         """Extract lighting setup information"""
-        # Number of fixtures
-        num_fix = re.search(r"(\d+)\s*x\s*HighBay\s*(\d+)\s*watt", text, re.IGNORECASE)
-        if not num_fix:
-            num_fix = re.search(r"(\d+)\s*fixtures?", text, re.IGNORECASE)
-        
-        # Average lux
-        avg_lux = re.search(r"Avr\.?lux\s*([\d.]+)", text, re.IGNORECASE)
-        if not avg_lux:
-            avg_lux = re.search(r"average\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-        
-        # Uniformity
-        uniformity = re.search(r"Uniformity\s*([\d.]+)", text, re.IGNORECASE)
-        if not uniformity:
-            uniformity = re.search(r"uniformity[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-        
-        # Total power
-        total_power = re.search(r"([\d.]+)\s*W", text)
-        if not total_power:
-            total_power = re.search(r"total\s*power[:\-]?\s*([\d.]+)\s*W", text, re.IGNORECASE)
-        
-        # Efficacy
-        efficacy = re.search(r"([\d.]+)\s*lm/W", text)
-        if not efficacy:
-            efficacy = re.search(r"efficacy[:\-]?\s*([\d.]+)\s*lm/W", text, re.IGNORECASE)
-
-        # Mounting height
-        mounting_height = re.search(r"mounting\s*height[:\-]?\s*([\d.]+)\s*m", text, re.IGNORECASE)
-
-        data["lighting_setup"] = {
-            "number_of_fixtures": int(num_fix.group(1)) if num_fix else None,
-            "fixture_type": f"HighBay {num_fix.group(2)} watt" if num_fix and len(num_fix.groups()) > 1 else "HighBay 150 watt",
-            "mounting_height_m": float(mounting_height.group(1)) if mounting_height else None,
-            "average_lux": float(avg_lux.group(1)) if avg_lux else None,
-            "uniformity": float(uniformity.group(1)) if uniformity else None,
-            "total_power_w": float(total_power.group(1)) if total_power else None,
-            "luminous_efficacy_lm_per_w": float(efficacy.group(1)) if efficacy else None,
-        }
+        extract_lighting_setup(text, data)
     
     def _extract_luminaires(self, text: str, data: Dict[str, Any]):
         """Extract luminaire information"""
-        # Primary pattern from added.txt
-        luminaire_matches = re.findall(r"(\d+)\s+([A-Za-z]+)\s+([A-Za-z0-9\- ]+)\s+(\d+\.?\d*)\s*W\s+(\d+\.?\d*)\s*lm\s+(\d+\.?\d*)\s*lm/W", text)
-        
-        # Alternative patterns
-        if not luminaire_matches:
-            manufacturer = re.search(r"manufacturer[:\-]?\s*([A-Za-z]+)", text, re.IGNORECASE)
-            article_no = re.search(r"article\s*no[:\-]?\s*([A-Za-z0-9\- ]+)", text, re.IGNORECASE)
-            power = re.search(r"(\d+\.?\d*)\s*W", text)
-            flux = re.search(r"(\d+\.?\d*)\s*lm", text)
-            efficacy_lum = re.search(r"(\d+\.?\d*)\s*lm/W", text)
-            quantity = re.search(r"quantity[:\-]?\s*(\d+)", text, re.IGNORECASE)
-            
-            if manufacturer or power:
-                luminaire_matches = [(
-                    quantity.group(1) if quantity else "1",
-                    manufacturer.group(1) if manufacturer else "Unknown",
-                    article_no.group(1) if article_no else "Unknown",
-                    power.group(1) if power else "0",
-                    flux.group(1) if flux else "0",
-                    efficacy_lum.group(1) if efficacy_lum else "0"
-                )]
-        
-        for match in luminaire_matches:
-            data["luminaires"].append({
-                "quantity": int(match[0]),
-                "manufacturer": match[1],
-                "article_no": match[2],
-                "power_w": float(match[3]),
-                "luminous_flux_lm": float(match[4]),
-                "efficacy_lm_per_w": float(match[5])
-            })
+        extract_luminaires(text, data)
     
     def _extract_rooms(self, text: str, data: Dict[str, Any]):
         """Extract room information with enhanced layout extraction"""
-        # Enhanced room name patterns
-        room_patterns = [
-            r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",
-            r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",
-            r"(Room\s*\d+)",
-            r"(Building\s*\d+.*?Room\s*\d+)"
-        ]
-        
-        # Enhanced coordinate patterns - multiple formats
-        coord_patterns = [
-            r"(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m",  # "4.000 m 36.002 m 7.000 m"
-            r"(\d+\.?\d*)\s*,\s*(\d+\.?\d*)\s*,\s*(\d+\.?\d*)",      # "4.000, 36.002, 7.000"
-            r"(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)",              # "4.000 36.002 7.000"
-            r"X[:\-]?\s*(\d+\.?\d*)\s*Y[:\-]?\s*(\d+\.?\d*)\s*Z[:\-]?\s*(\d+\.?\d*)",  # "X: 4.000 Y: 36.002 Z: 7.000"
-            r"(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm"  # "4000.000 mm 36002.000 mm 7000.000 mm"
-        ]
-        
-        # Enhanced arrangement patterns
-        arrangement_patterns = [
-            r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",
-            r"Layout[:\-]?\s*([A-Za-z0-9]+)",
-            r"Pattern[:\-]?\s*([A-Za-z0-9]+)",
-            r"([A-Za-z0-9]+)\s*arrangement"
-        ]
-        
-        # Find all room matches
-        all_rooms = []
-        for pattern in room_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if match not in [room["name"] for room in all_rooms]:
-                    all_rooms.append({"name": match.strip()})
+        # Find all room matches; a dict keeps first-seen order and makes dedup O(1)
+        room_names = {}
+        for pattern in _ROOM_RES:
+            for match in pattern.finditer(text):
+                room_names.setdefault(match.group(1).strip(), None)
+        all_rooms = [{"name": name} for name in room_names]
         
         # If no rooms found with patterns, try to find any room-like text
         if not all_rooms:
             # Look for any text that might be room names
-            potential_rooms = re.findall(r"([A-Za-z\s]+\d+[A-Za-z\s]*\d*)", text)
+            potential_rooms = _ROOM_LIKE_RE.findall(text)
             for room_text in potential_rooms:
                 if "room" in room_text.lower() or "building" in room_text.lower():
                     all_rooms.append({"name": room_text.strip()})
         
-        # Extract coordinates using all patterns
+        # Extract coordinates using all patterns, then convert them in one batch
+        raw_coords = []
+        in_mm = []  # mm values are converted to meters
+        for coord_re in _COORD_RES:
+            is_mm = coord_re.pattern.endswith("mm")
+            for match in coord_re.finditer(text):
+                raw_coords.append(match.groups())
+                in_mm.append(is_mm)
+        
+        # The patterns overlap, so keep each point only once
         all_coords = []
-        for coord_pattern in coord_patterns:
-            matches = re.findall(coord_pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    x, y, z = float(match[0]), float(match[1]), float(match[2])
-                    # Convert mm to meters if needed
-                    if coord_pattern.endswith("mm"):
-                        x, y, z = x/1000, y/1000, z/1000
-                    all_coords.append({"x_m": x, "y_m": y, "z_m": z})
-                except (ValueError, IndexError):
-                    continue
+        seen_coords = set()
+        for x, y, z in _parse_points(raw_coords, in_mm):
+            if (x, y, z) in seen_coords:
+                continue
+            seen_coords.add((x, y, z))
+            all_coords.append({"x_m": x, "y_m": y, "z_m": z})
         
         # Extract arrangements
         arrangements = []
-        for pattern in arrangement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _ARRANGEMENT_RES:
+            matches = pattern.findall(text)
             arrangements.extend(matches)
         
         # Process rooms
@@ -284,7 +269,8 @@ class FinalPDFExtractor:
             # Assign coordinates to this room
             # For now, we'll assign all coordinates to each room
             # In a more sophisticated version, we could try to match coordinates to specific rooms
-            layout = all_coords.copy() if all_coords else []
+            # (rooms share one layout list; it is not modified after parsing)
+            layout = all_coords
             
             data["rooms"].append({
                 "name": room_name,
@@ -302,54 +288,38 @@ class FinalPDFExtractor:
     
     def _extract_scenes(self, text: str, data: Dict[str, Any]):
         """Extract scene information"""
-        # Primary pattern from added.txt
-        scene_matches = re.findall(
-            r"([A-Za-z ]+)\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)",
-            text
-        )
-        
-        if not scene_matches:
-            # Alternative approach
-            scene_names = re.findall(r"scene\s*name[:\-]?\s*(.+)", text, re.IGNORECASE)
-            if not scene_names:
-                scene_names = ["the factory", "working place"]
-            
-            for scene_name in scene_names:
-                scene_name = scene_name.strip()
-                avg_lux_scene = re.search(r"average\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-                min_lux_scene = re.search(r"min\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-                max_lux_scene = re.search(r"max\s*lux[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-                uniformity_scene = re.search(r"uniformity[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
-                
-                data["scenes"].append({
-                    "scene_name": scene_name,
-                    "average_lux": float(avg_lux_scene.group(1)) if avg_lux_scene else None,
-                    "min_lux": float(min_lux_scene.group(1)) if min_lux_scene else None,
-                    "max_lux": float(max_lux_scene.group(1)) if max_lux_scene else None,
-                    "uniformity": float(uniformity_scene.group(1)) if uniformity_scene else None,
-                    "utilisation_profile": "Health care premises - Operating areas (5.46.1 Pre-op and recovery rooms)"
-                })
-        else:
-            for sm in scene_matches:
-                data["scenes"].append({
-                    "scene_name": sm[0].strip(),
-                    "average_lux": float(sm[1]),
-                    "min_lux": float(sm[2]),
-                    "max_lux": float(sm[3]),
-                    "uniformity": float(sm[4]),
-                    "utilisation_profile": "Health care premises - Operating areas (5.46.1 Pre-op and recovery rooms)"
-                })
+        extract_scenes(text, data)
     
-    def process_report(self, pdf_path: str) -> Dict[str, Any]:
-        """Main processing function"""
+    def process_report(self, pdf_path: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Main processing function (results and text are cached by PDF content hash)"""
         print(f"Processing: {pdf_path}")
+        filename = os.path.basename(pdf_path)
         
-        # Extract text
-        text = self.extract_text(pdf_path)
-        print(f"Extracted {len(text)} characters")
+        key = file_digest(pdf_path) if use_cache and CACHE_DIR else None
+        if key:
+            cached = cache_read(CACHE_DIR, f"{key}.{_PARSER_FINGERPRINT}.json")
+            if cached is not None:
+                print("Using cached result")
+                data = json.loads(cached)
+                data["metadata"]["report_title"] = filename
+                return data
+        
+        text = cache_read(CACHE_DIR, key + _TEXT_CACHE_SUFFIX) if key else None
+        if text is not None:
+            print(f"Using cached text: {len(text)} characters")
+        else:
+            # Extract text
+            text = self.extract_text(pdf_path)
+            print(f"Extracted {len(text)} characters")
+            # Empty text usually means a failed extraction; don't cache it
+            if key and text:
+                cache_write(CACHE_DIR, key + _TEXT_CACHE_SUFFIX, text)
         
         # Parse data
-        data = self.parse_report(text, os.path.basename(pdf_path))
+        data = self.parse_report(text, filename)
+        
+        if key:
+            cache_write(CACHE_DIR, f"{key}.{_PARSER_FINGERPRINT}.json", json.dumps(data, ensure_ascii=False))
         
         return data
 
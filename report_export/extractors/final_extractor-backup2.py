@@ -14,14 +14,268 @@ Version: 1.0
 """
 
 import pdfplumber
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 import pytesseract
 import re
 import json
 import os
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, List, Optional, Set
 import sys
+
+# Metadata patterns, the single-pass metadata scan and the optional Hyperscan
+# prefilter are shared with enhanced_parser.py. This file's name isn't a valid
+# module name, so it is never part of the package; import the shared code
+# from its own directory
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+from _shared_cache import CACHE_DIR, cache_read, cache_write, file_digest
+from _shared_sections import build_prefilter, candidate_patterns, may_match, scan_metadata
+
+try:
+    # Optional second text-layer extractor; imported once so a missing
+    # PyMuPDF isn't retried on every PDF
+    import fitz
+except ImportError:
+    fitz = None
+
+try:
+    # Optional; converts coordinate matches in bulk
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional in-process Tesseract binding; keeps the engine loaded between pages
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+
+# -----------------------------------------------------
+# EXTRACTED TEXT CACHE
+# -----------------------------------------------------
+# Extracted text is cached on disk keyed by a hash of the PDF's bytes, so
+# reprocessing an unchanged file skips pdfplumber/PyMuPDF/OCR entirely.
+# The helpers and CACHE_DIR are in _shared_cache.py.
+# This extractor tries pdfplumber first, so its text can differ from the
+# other extractors' cached text for the same PDF; keep its entries separate
+_TEXT_CACHE_SUFFIX = ".backup2.txt"
+
+
+# -----------------------------------------------------
+# OCR SETTINGS
+# -----------------------------------------------------
+OCR_CHUNK_PAGES = 8         # pages rasterised at a time; bounds peak memory on long scans
+OCR_WORKER_MEMORY_MB = 200  # rough resident size of one Tesseract process
+# Chunks are rendered at OCR_FAST_DPI first (under half the pixels of 300 DPI)
+# and re-rendered at OCR_DPI only if that yields under OCR_MIN_CHARS_PER_PAGE
+OCR_FAST_DPI = 200
+OCR_DPI = 300
+OCR_MIN_CHARS_PER_PAGE = 200
+
+
+def _get_max_workers(n_tasks: int) -> int:
+    """
+    Number of OCR worker processes: one per CPU, capped by the number of
+    tasks and by how many Tesseract processes fit in available memory.
+    """
+    workers = os.cpu_count() or 1
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        workers = min(workers, max(1, available // (OCR_WORKER_MEMORY_MB * 1024 * 1024)))
+    except (AttributeError, ValueError, OSError):
+        pass  # no sysconf (Windows); rely on the CPU count
+    return max(1, min(workers, n_tasks))
+
+
+# Each OCR worker process's own tesserocr engine, set up by _init_ocr_worker
+_tess_api = None
+
+
+def _init_ocr_worker():
+    """Pool initializer: load the Tesseract model once per worker when tesserocr is installed"""
+    global _tess_api
+    if PyTessBaseAPI is not None:
+        try:
+            _tess_api = PyTessBaseAPI(lang="eng")
+        except Exception as e:
+            print(f"tesserocr unavailable, using pytesseract: {e}")
+
+
+def _ocr_image(image) -> str:
+    """OCR one page image, in-process with tesserocr if the worker has it, else via pytesseract"""
+    if _tess_api is not None:
+        try:
+            _tess_api.SetImage(image)
+            return _tess_api.GetUTF8Text()
+        except Exception as e:
+            print(f"tesserocr failed, falling back to pytesseract: {e}")
+    return pytesseract.image_to_string(image)
+
+
+# -----------------------------------------------------
+# BORN-DIGITAL DETECTION
+# -----------------------------------------------------
+BORN_DIGITAL_PROBE_PAGES = 3     # pages sampled from the start of the PDF
+BORN_DIGITAL_MIN_CHARS = 200     # text-layer characters on those pages that mark it born-digital
+MIN_TEXT_CHARS = 100             # shorter text from an unknown PDF still gets OCR'd
+
+
+def _is_born_digital(pdf) -> Optional[bool]:
+    """
+    Whether an open pdfplumber PDF has a real text layer, judged from the
+    characters on its first few pages. None if it couldn't be opened or read.
+    """
+    if pdf is None:
+        return None
+    try:
+        n_chars = sum(len(page.chars) for page in pdf.pages[:BORN_DIGITAL_PROBE_PAGES])
+    except Exception as e:
+        print(f"Born-digital check failed: {e}")
+        return None
+    return n_chars > BORN_DIGITAL_MIN_CHARS
+
+
+# -----------------------------------------------------
+# PARALLEL PDFPLUMBER EXTRACTION
+# -----------------------------------------------------
+# Below this many pages, starting worker processes costs more than it saves
+PDFPLUMBER_PARALLEL_MIN_PAGES = 32
+# pdfplumber runs no pdfminer layout analysis here (laparams is unset); what
+# extract_text() still does is cluster chars into lines by position. True
+# skips that and keeps content-stream order: faster, but some PDFs' stream
+# order isn't reading order, which would break line-based patterns
+PDFPLUMBER_USE_TEXT_FLOW = False
+
+
+def _pdfplumber_page_block(pdf_path: str, first: int, last: int) -> List[str]:
+    """
+    Non-empty page texts of pages first..last-1 (0-based), for a pool worker.
     
+    The worker opens only its own pages (pdfplumber's pages= is 1-based).
+    """
+    parts = []
+    with pdfplumber.open(pdf_path, pages=list(range(first + 1, last + 1))) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text(use_text_flow=PDFPLUMBER_USE_TEXT_FLOW)  # expensive; call it once per page
+            page.flush_cache()  # drop the page's parsed objects; only its text is kept
+            if page_text:
+                parts.append(page_text)
+    return parts
+
+
+# -----------------------------------------------------
+# PRECOMPILED PATTERNS
+# -----------------------------------------------------
+# Compiled once at import time so the _extract_* methods never recompile a
+# pattern or go through re's internal pattern cache on each call
+
+# Primary DIALux-style lighting setup line:
+# "673 lx 277 lx 949 lx 0.41 0.49 CG6"
+# Where: avg_lux min_lux max_lux uniformity g1_index lighting_class
+# A match can't start inside a number: the search skips straight to its first digit
+_DIALUX_RE = re.compile(
+    r"(?<![\d.])"
+    r"([\d.]+)\s*lx\s+"     # Group 1: Average lux value (e.g., "673")
+    r"([\d.]+)\s*lx\s+"     # Group 2: Minimum lux value (e.g., "277") 
+    r"([\d.]+)\s*lx\s+"     # Group 3: Maximum lux value (e.g., "949")
+    r"([\d.]+)\s+"          # Group 4: Uniformity ratio (e.g., "0.41")
+    r"([\d.]+)\s+"          # Group 5: G1 index value (e.g., "0.49")
+    r"([A-Za-z0-9]+)"       # Group 6: Lighting class index (e.g., "CG6")
+)
+
+# Fallback lighting setup fields
+# Matches "Avr.lux:", "Average lux:", "Avr lux -", etc.
+_AVG_LUX_RE = re.compile(r"(?:Avr\.?lux|Average\s*lux)[:\-]?\s*([\d.]+)", re.IGNORECASE)
+# Matches "Uniformity:", "Uo:", "Uniformity -", etc.
+_UNIFORMITY_RE = re.compile(r"(?:Uniformity|Uo)[:\-]?\s*([\d.]+)", re.IGNORECASE)
+
+# Comprehensive luminaire specification pattern
+# Matches format: "36 Philips BY698P LED265CW G2 WB 150.0 W 21750 lm 145.0 lm/W"
+# Quantity must start a number, so a row that fails isn't retried from every
+# digit inside it. The article stays unbounded: a length cap makes long rows
+# match again from a later number, with the wrong quantity and manufacturer
+_LUMINAIRE_RE = re.compile(
+    r"(?<!\d)(\d+)\s+"                    # Group 1: Quantity (digits only)
+    r"([A-Za-z]+)\s+"                     # Group 2: Manufacturer (letters only)
+    r"([A-Za-z0-9\- ]+)\s+"               # Group 3: Article/model (letters, numbers, hyphens, spaces)
+    r"(\d+\.?\d*)\s*W\s+"                # Group 4: Power in watts (decimal number + "W")
+    r"(\d+\.?\d*)\s*lm\s+"               # Group 5: Luminous flux in lumens (decimal number + "lm")
+    r"(\d+\.?\d*)\s*lm/W"                # Group 6: Efficacy in lm/W (decimal number + "lm/W")
+)
+
+# Room name patterns - multiple formats to handle different naming conventions
+# Pattern 1: "Building 1 · Storey 1 · Room 1" (with bullet separators)
+# Pattern 2: "Building 1 Storey 1 Room 1" (with space separators)
+# Pattern 3: "Room 1" (simple room number)
+# Pattern 4: "Building 1 ... Room 1" (flexible building-room format)
+_ROOM_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",  # Bullet-separated format
+    r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",           # Space-separated format
+    r"(Room\s*\d+)",                                           # Simple room number
+    r"(Building\s*\d+.*?Room\s*\d+)"                          # Flexible building-room format
+))
+
+# Coordinate patterns - multiple formats to handle different coordinate representations
+# Pattern 1: "4.000 m 36.002 m 7.000 m" (meters with unit labels)
+# Pattern 2: "4000.000 mm 36002.000 mm 7000.000 mm" (millimeters with unit labels)
+# Pattern 3: "X: 4000.000 mm Y: 36002.000 mm Z: 7000.000 mm" (labeled coordinates in mm)
+# Pattern 4: "X: 4.000 Y: 36.002 Z: 7.000" (labeled coordinates in meters)
+_COORD_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m",  # Meters with unit labels
+    r"(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm",  # Millimeters with unit labels
+    r"X\s*[:\-]?\s*(\d+\.?\d*)\s*mm\s*Y\s*[:\-]?\s*(\d+\.?\d*)\s*mm\s*Z\s*[:\-]?\s*(\d+\.?\d*)\s*mm",  # Labeled mm coordinates
+    r"X\s*[:\-]?\s*(\d+\.?\d*)\s*Y\s*[:\-]?\s*(\d+\.?\d*)\s*Z\s*[:\-]?\s*(\d+\.?\d*)"  # Labeled meter coordinates
+))
+
+# Arrangement patterns - multiple formats to handle different arrangement labels
+# Pattern 1: "Arrangement: A1" or "Arrangement - A1"
+# Pattern 2: "Layout: A1" or "Layout - A1"
+# Pattern 3: "Pattern: A1" or "Pattern - A1"
+# Pattern 4: "A1 arrangement" (reverse format)
+_ARRANGEMENT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",  # Standard arrangement label
+    r"Layout[:\-]?\s*([A-Za-z0-9]+)",       # Layout label variant
+    r"Pattern[:\-]?\s*([A-Za-z0-9]+)",      # Pattern label variant
+    r"([A-Za-z0-9]+)\s*arrangement"         # Reverse arrangement format
+))
+
+# Scene line with optional scene name and comprehensive metrics
+# Pattern matches: "Scene Name 673 lx 277 lx 949 lx 0.41 0.49 CG6"
+_SCENE_METRICS = r"([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s+([\d.]+)\s+([A-Za-z0-9]+)"
+_SCENE_RE = re.compile(r"(?:([A-Za-z ]+)\s+)?" + _SCENE_METRICS)
+# The same pattern with the name starting a run of letters/spaces. A name that
+# fails from the start of a run fails from anywhere inside it, so this skips
+# the quadratic retries of _SCENE_RE on long runs of words
+_SCENE_RUN_RE = re.compile(r"(?:(?<![A-Za-z ])([A-Za-z ]+)\s+)?" + _SCENE_METRICS)
+_SCENE_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ")
+
+# Field patterns screened together in one Hyperscan pass per report, so
+# patterns that can't match are never run (no-op without Hyperscan)
+_PREFILTERED_RES = (_DIALUX_RE, _AVG_LUX_RE, _UNIFORMITY_RE, _LUMINAIRE_RE, _SCENE_RE)
+_PREFILTER_DB = build_prefilter(_PREFILTERED_RES)
+
+
+def _find_scenes(text: str) -> List[tuple]:
+    """_SCENE_RE.findall(text), without retrying the name inside runs of words"""
+    scenes = []
+    pos = 0
+    while True:
+        match = None
+        if 0 < pos < len(text) and text[pos - 1] in _SCENE_NAME_CHARS and text[pos] in _SCENE_NAME_CHARS:
+            # The previous match ended inside a run; findall would resume the
+            # name right here, where _SCENE_RUN_RE's lookbehind can't
+            match = _SCENE_RE.match(text, pos)
+        if match is None:
+            match = _SCENE_RUN_RE.search(text, pos)
+        if match is None:
+            return scenes
+        scenes.append(match.groups(""))
+        pos = match.end()
+
 
 # class FinalPDFExtractor:
 #     """Final PDF extractor combining all approaches"""
@@ -68,6 +322,13 @@ class FinalPDFExtractor:
         if not os.path.exists(alias_path):
             raise FileNotFoundError(f"Alias file not found: {alias_path}")
 
+        # On-disk cache of extracted text (None or "" disables it)
+        self.cache_dir = CACHE_DIR
+
+        # pdfplumber document opened once by extract_text() and shared by the
+        # born-digital check and _extract_with_pdfplumber(); None otherwise
+        self._current_pdf = None
+
         # Set up text extraction methods in order of preference
         self.text_extractors = [
             self._extract_with_pdfplumber,
@@ -78,6 +339,12 @@ class FinalPDFExtractor:
         with open(alias_path, "r", encoding="utf-8") as f:
             self.aliases = json.load(f)
 
+        # Reverse lookups (lowercased alias -> canonical name), built once so
+        # normalization is a single dict hit; the first canonical name listing
+        # an alias wins, as with the original in-order scan
+        self._param_lookup = self._build_lookup(self.aliases["parameters"])
+        self._place_lookup = self._build_lookup(self.aliases["places"])
+
     # -----------------------------------------------------
     # TEXT EXTRACTION METHODS
     # -----------------------------------------------------
@@ -94,15 +361,38 @@ class FinalPDFExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        parts = []
+        pdf = None
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            cpus = os.cpu_count() or 1
+            # Reuse the document extract_text() already opened, if any
+            pdf = self._current_pdf if self._current_pdf is not None else pdfplumber.open(pdf_path)
+            n_pages = len(pdf.pages)
+            parallel = cpus > 1 and n_pages >= PDFPLUMBER_PARALLEL_MIN_PAGES
+            if not parallel:
                 for page in pdf.pages:
-                    if page.extract_text():
-                        text += page.extract_text() + "\n"
+                    page_text = page.extract_text(use_text_flow=PDFPLUMBER_USE_TEXT_FLOW)  # expensive; call it once per page
+                    # Drop the page's parsed chars and layout objects, so memory
+                    # holds one parsed page at a time rather than the whole PDF
+                    page.flush_cache()
+                    if page_text:
+                        parts.append(page_text)
+            if parallel:
+                # Long document: extract blocks of pages in parallel processes,
+                # several blocks per worker to balance uneven pages, and
+                # reassemble them in page order
+                block = max(1, n_pages // (4 * cpus))
+                starts = range(0, n_pages, block)
+                ends = [min(start + block, n_pages) for start in starts]
+                with ProcessPoolExecutor(max_workers=min(cpus, len(ends))) as executor:
+                    for block_parts in executor.map(_pdfplumber_page_block, repeat(pdf_path), starts, ends):
+                        parts.extend(block_parts)
         except Exception as e:
             print(f"pdfplumber error: {e}")
-        return text.strip()
+        finally:
+            if pdf is not None and pdf is not self._current_pdf:
+                pdf.close()
+        return "\n".join(parts).strip()
 
     def _extract_with_pymupdf(self, pdf_path: str) -> str:
         """
@@ -118,17 +408,17 @@ class FinalPDFExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        if fitz is None:
+            return ""
+        parts = []
         try:
-            import fitz
-            doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text() + "\n"
-            doc.close()
+            with fitz.open(pdf_path) as doc:  # closed even if a page fails
+                for page in doc:
+                    # Plain text in content-stream order; no sorting pass
+                    parts.append(page.get_text("text", sort=False))
         except Exception as e:
             print(f"PyMuPDF error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
 
     def _ocr_pdf(self, pdf_path: str) -> str:
         """
@@ -144,14 +434,28 @@ class FinalPDFExtractor:
         Returns:
             str: OCR extracted text content, or empty string if extraction fails
         """
-        text = ""
+        texts = []
         try:
-            pages = convert_from_path(pdf_path, dpi=300)
-            for page in pages:
-                text += pytesseract.image_to_string(page) + "\n"
+            n_pages = pdfinfo_from_path(pdf_path)["Pages"]
+            # Pages are OCR'd in parallel processes; they are rasterised a chunk
+            # at a time so a long scan never holds every page image in memory
+            cpus = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=_get_max_workers(n_pages),
+                                     initializer=_init_ocr_worker) as executor:
+                for first in range(1, n_pages + 1, OCR_CHUNK_PAGES):
+                    last = min(first + OCR_CHUNK_PAGES - 1, n_pages)
+                    render = dict(first_page=first, last_page=last, grayscale=True,
+                                  thread_count=min(cpus, last - first + 1))
+                    pages = convert_from_path(pdf_path, dpi=OCR_FAST_DPI, **render)
+                    chunk = list(executor.map(_ocr_image, pages))
+                    if sum(len(t.strip()) for t in chunk) < OCR_MIN_CHARS_PER_PAGE * len(pages):
+                        print(f"Little text found at {OCR_FAST_DPI} DPI, retrying pages {first}-{last} at {OCR_DPI} DPI")
+                        pages = convert_from_path(pdf_path, dpi=OCR_DPI, **render)
+                        chunk = list(executor.map(_ocr_image, pages))
+                    texts.extend(chunk)
         except Exception as e:
             print(f"OCR error: {e}")
-        return text.strip()
+        return "\n".join(texts).strip()
 
     def extract_text(self, pdf_path: str) -> str:
         """
@@ -162,17 +466,58 @@ class FinalPDFExtractor:
         2. PyMuPDF (alternative text extraction)
         3. OCR (slowest, but works with scanned PDFs)
         
+        _is_born_digital() picks the branch: born-digital PDFs use only the
+        text extractors, scanned ones go straight to OCR.
+        
+        Text already extracted from a PDF with the same contents is read
+        back from the cache in self.cache_dir instead.
+        
         Args:
             pdf_path (str): Path to the PDF file to extract text from
             
         Returns:
             str: Extracted text content from the most successful method
         """
-        for extractor in self.text_extractors:
-            text = extractor(pdf_path)
-            if text and len(text) > 50:
-                return text
-        return self._ocr_pdf(pdf_path)
+        key = None
+        if self.cache_dir:
+            try:
+                key = file_digest(pdf_path) + _TEXT_CACHE_SUFFIX
+            except OSError:
+                pass  # unreadable file; let the extractors report it
+        if key:
+            cached = cache_read(self.cache_dir, key)
+            if cached is not None:
+                print("Using cached text")
+                return cached
+
+        # Open the PDF once; the xref table and pages parsed here are reused
+        # by the born-digital check and the pdfplumber extractor
+        try:
+            self._current_pdf = pdfplumber.open(pdf_path)
+        except Exception as e:
+            print(f"pdfplumber error: {e}")
+        try:
+            # Born-digital PDFs never need OCR and scans never have a usable
+            # text layer; only a PDF that couldn't be checked tries both
+            born_digital = _is_born_digital(self._current_pdf)
+            text = ""
+            if born_digital is not False:
+                for extractor in self.text_extractors:
+                    text = extractor(pdf_path)
+                    if text:
+                        break
+            if not born_digital and len(text) <= MIN_TEXT_CHARS:
+                ocr_text = self._ocr_pdf(pdf_path)
+                if len(ocr_text) > len(text):
+                    text = ocr_text
+        finally:
+            if self._current_pdf is not None:
+                self._current_pdf.close()
+                self._current_pdf = None
+        # Empty text usually means a failed extraction; don't cache it
+        if key and text:
+            cache_write(self.cache_dir, key, text)
+        return text
 
     def process_report(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -203,6 +548,15 @@ class FinalPDFExtractor:
     # -----------------------------------------------------
     # NORMALIZATION USING ALIASES
     # -----------------------------------------------------
+    @staticmethod
+    def _build_lookup(alias_groups: Dict[str, Any]) -> Dict[str, str]:
+        """Invert {canonical: [aliases]} into {lowercased alias: canonical}"""
+        lookup = {}
+        for standard, variations in alias_groups.items():
+            for v in variations:
+                lookup.setdefault(v.lower(), standard)
+        return lookup
+
     def normalize_parameter(self, param: str) -> str:
         """
         Normalize parameter names using the alias mapping system.
@@ -217,10 +571,7 @@ class FinalPDFExtractor:
             str: The normalized parameter name, or original if no mapping found
         """
         param = param.lower().strip()
-        for standard, variations in self.aliases["parameters"].items():
-            if param in [v.lower() for v in variations]:
-                return standard
-        return param
+        return self._param_lookup.get(param, param)
 
     def normalize_place(self, place: str) -> str:
         """
@@ -236,10 +587,7 @@ class FinalPDFExtractor:
             str: The normalized place name, or original if no mapping found
         """
         place = place.lower().strip()
-        for standard, variations in self.aliases["places"].items():
-            if place in [v.lower() for v in variations]:
-                return standard
-        return place
+        return self._place_lookup.get(place, place)
 
     # -----------------------------------------------------
     # METADATA EXTRACTION
@@ -256,53 +604,20 @@ class FinalPDFExtractor:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with extracted metadata
         """
-        # Company name extraction with multiple pattern matching
-        # Pattern 1: Matches "Company", "Short Cicuit", or "Short Circuit" followed by any text until newline or end
-        # Pattern 2: Matches "Company Name:" or "Company Name-" followed by the actual name
-        # Pattern 3: Exact match for "Short Cicuit Company" (common typo in reports)
-        company_patterns = [
-            r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",  # Flexible company name matching
-            r"Company\s*Name[:\-]?\s*(.+)",  # Structured company name field
-            r"Short\s*Cicuit\s*Company"  # Exact match for known company name
-        ]
-        for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            if match:
-                data["metadata"]["company_name"] = match.group(0).strip()  # Clean whitespace
-                break  # Use first successful match
-
-        # Project name extraction with multiple pattern matching
-        # Pattern 1: Matches "Project Name" or "Lighting study" followed by content until newline
-        # Pattern 2: Structured project name field with colon or dash separator
-        # Pattern 3: Matches "Lighting study for" followed by project description
-        project_patterns = [
-            r"(Project\s*Name|Lighting study.*?)\n",  # Multi-line project name
-            r"Project\s*Name[:\-]?\s*(.+)",  # Structured project name field
-            r"Lighting\s*study\s*for\s*(.+)"  # Descriptive project name format
-        ]
-        for pattern in project_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            if match:
-                data["metadata"]["project_name"] = match.group(0).strip()  # Clean whitespace
-                break  # Use first successful match
-
-        # Engineer name extraction
-        # Matches "Eng." followed by engineer's name (common format in reports)
-        engineer_match = re.search(r"Eng\.\s*[A-Za-z ]+", text)
-        if engineer_match:
-            data["metadata"]["engineer"] = engineer_match.group(0).strip()  # Clean whitespace
-
-        # Email address extraction
-        # Matches standard email format: username@domain.com
-        # Uses word characters, dots, and hyphens for username and domain
-        email_match = re.search(r"[\w\.-]+@[\w\.-]+", text)
-        if email_match:
-            data["metadata"]["email"] = email_match.group(0).strip()  # Clean whitespace
+        # All four fields come from one pass over the text: a lookahead
+        # alternation of every metadata pattern finds candidate positions, and
+        # each field keeps the first hit of its highest-priority pattern
+        # - company: "Company"/"Short Cicuit"/"Short Circuit" line, "Company Name:", "Short Cicuit Company"
+        # - project: "Project Name"/"Lighting study" line, "Project Name:", "Lighting study for ..."
+        # - engineer: "Eng." followed by the engineer's name
+        # - email: standard username@domain.com format
+        data["metadata"].update(scan_metadata(text))
 
     # -----------------------------------------------------
     # LIGHTING SETUP EXTRACTION
     # -----------------------------------------------------
-    def _extract_lighting_setup(self, text: str, data: Dict[str, Any]):
+    def _extract_lighting_setup(self, text: str, data: Dict[str, Any],
+                                candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract lighting setup information from the PDF text.
         
@@ -313,23 +628,14 @@ class FinalPDFExtractor:
         Args:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with lighting setup info
+            candidates: Patterns that passed the prefilter (None runs them all)
         """
 
         lighting_setup = {}
 
         # Primary DIALux-style pattern matching
-        # This regex captures the standard DIALux output format:
-        # "673 lx 277 lx 949 lx 0.41 0.49 CG6"
-        # Where: avg_lux min_lux max_lux uniformity g1_index lighting_class
-        match = re.search(
-            r"([\d.]+)\s*lx\s+"     # Group 1: Average lux value (e.g., "673")
-            r"([\d.]+)\s*lx\s+"     # Group 2: Minimum lux value (e.g., "277") 
-            r"([\d.]+)\s*lx\s+"     # Group 3: Maximum lux value (e.g., "949")
-            r"([\d.]+)\s+"          # Group 4: Uniformity ratio (e.g., "0.41")
-            r"([\d.]+)\s+"          # Group 5: G1 index value (e.g., "0.49")
-            r"([A-Za-z0-9]+)",      # Group 6: Lighting class index (e.g., "CG6")
-            text
-        )
+        # Captures "673 lx 277 lx 949 lx 0.41 0.49 CG6" (see _DIALUX_RE)
+        match = _DIALUX_RE.search(text) if may_match(_DIALUX_RE, candidates) else None
 
         if match:
             # Extract all captured groups from the DIALux pattern
@@ -348,13 +654,13 @@ class FinalPDFExtractor:
             
             # Average lux extraction with multiple label variations
             # Matches "Avr.lux:", "Average lux:", "Avr lux -", etc.
-            avg_lux = re.search(r"(?:Avr\.?lux|Average\s*lux)[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
+            avg_lux = _AVG_LUX_RE.search(text) if may_match(_AVG_LUX_RE, candidates) else None
             if avg_lux:
                 lighting_setup["average_lux"] = float(avg_lux.group(1))  # Convert to float
             
             # Uniformity extraction with multiple label variations
             # Matches "Uniformity:", "Uo:", "Uniformity -", etc.
-            uniformity = re.search(r"(?:Uniformity|Uo)[:\-]?\s*([\d.]+)", text, re.IGNORECASE)
+            uniformity = _UNIFORMITY_RE.search(text) if may_match(_UNIFORMITY_RE, candidates) else None
             if uniformity:
                 lighting_setup["uniformity"] = float(uniformity.group(1))  # Convert to float
 
@@ -364,7 +670,8 @@ class FinalPDFExtractor:
     # -----------------------------------------------------
     # LUMINAIRE EXTRACTION
     # -----------------------------------------------------
-    def _extract_luminaires(self, text: str, data: Dict[str, Any]):
+    def _extract_luminaires(self, text: str, data: Dict[str, Any],
+                            candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract luminaire (lighting fixture) information from the PDF text.
         
@@ -376,6 +683,7 @@ class FinalPDFExtractor:
         Args:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with luminaire info
+            candidates: Patterns that passed the prefilter (None runs them all)
         """
         # Comprehensive luminaire specification pattern
         # Matches format: "36 Philips BY698P LED265CW G2 WB 150.0 W 21750 lm 145.0 lm/W"
@@ -385,15 +693,7 @@ class FinalPDFExtractor:
         # Group 4: Power in watts (e.g., "150.0")
         # Group 5: Luminous flux in lumens (e.g., "21750")
         # Group 6: Efficacy in lm/W (e.g., "145.0")
-        luminaire_matches = re.findall(
-            r"(\d+)\s+"                           # Group 1: Quantity (digits only)
-            r"([A-Za-z]+)\s+"                     # Group 2: Manufacturer (letters only)
-            r"([A-Za-z0-9\- ]+)\s+"              # Group 3: Article/model (letters, numbers, hyphens, spaces)
-            r"(\d+\.?\d*)\s*W\s+"                # Group 4: Power in watts (decimal number + "W")
-            r"(\d+\.?\d*)\s*lm\s+"               # Group 5: Luminous flux in lumens (decimal number + "lm")
-            r"(\d+\.?\d*)\s*lm/W",               # Group 6: Efficacy in lm/W (decimal number + "lm/W")
-            text
-        )
+        luminaire_matches = _LUMINAIRE_RE.findall(text) if may_match(_LUMINAIRE_RE, candidates) else []
         
         # Process each matched luminaire specification
         for match in luminaire_matches:
@@ -422,89 +722,61 @@ class FinalPDFExtractor:
             data (Dict[str, Any]): Data dictionary to populate with room layout info
         """
 
-        # Room name patterns - multiple formats to handle different naming conventions
-        # Pattern 1: "Building 1 · Storey 1 · Room 1" (with bullet separators)
-        # Pattern 2: "Building 1 Storey 1 Room 1" (with space separators)
-        # Pattern 3: "Room 1" (simple room number)
-        # Pattern 4: "Building 1 ... Room 1" (flexible building-room format)
-        room_patterns = [
-            r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",  # Bullet-separated format
-            r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",           # Space-separated format
-            r"(Room\s*\d+)",                                           # Simple room number
-            r"(Building\s*\d+.*?Room\s*\d+)"                          # Flexible building-room format
-        ]
-
-        # Coordinate patterns - multiple formats to handle different coordinate representations
-        # Pattern 1: "4.000 m 36.002 m 7.000 m" (meters with unit labels)
-        # Pattern 2: "4000.000 mm 36002.000 mm 7000.000 mm" (millimeters with unit labels)
-        # Pattern 3: "X: 4000.000 mm Y: 36002.000 mm Z: 7000.000 mm" (labeled coordinates in mm)
-        # Pattern 4: "X: 4.000 Y: 36.002 Z: 7.000" (labeled coordinates in meters)
-        coord_patterns = [
-            r"(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m\s+(\d+\.?\d*)\s*m",  # Meters with unit labels
-            r"(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm\s+(\d+\.?\d*)\s*mm",  # Millimeters with unit labels
-            r"X\s*[:\-]?\s*(\d+\.?\d*)\s*mm\s*Y\s*[:\-]?\s*(\d+\.?\d*)\s*mm\s*Z\s*[:\-]?\s*(\d+\.?\d*)\s*mm",  # Labeled mm coordinates
-            r"X\s*[:\-]?\s*(\d+\.?\d*)\s*Y\s*[:\-]?\s*(\d+\.?\d*)\s*Z\s*[:\-]?\s*(\d+\.?\d*)"  # Labeled meter coordinates
-        ]
-
-        # Arrangement patterns - multiple formats to handle different arrangement labels
-        # Pattern 1: "Arrangement: A1" or "Arrangement - A1"
-        # Pattern 2: "Layout: A1" or "Layout - A1"
-        # Pattern 3: "Pattern: A1" or "Pattern - A1"
-        # Pattern 4: "A1 arrangement" (reverse format)
-        arrangement_patterns = [
-            r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",  # Standard arrangement label
-            r"Layout[:\-]?\s*([A-Za-z0-9]+)",       # Layout label variant
-            r"Pattern[:\-]?\s*([A-Za-z0-9]+)",      # Pattern label variant
-            r"([A-Za-z0-9]+)\s*arrangement"         # Reverse arrangement format
-        ]
-
-        # Collect unique room names using all room patterns
-        all_rooms = []
-        for pattern in room_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            for match in matches:
-                # Avoid duplicate room names by checking existing rooms
-                if match not in [r["name"] for r in all_rooms]:
-                    all_rooms.append({"name": match.strip()})  # Clean whitespace
+        # Collect unique room names using all room patterns, keyed by
+        # lowercase name (case-insensitive dedup). Exact repeats of a listed
+        # name are skipped; among different spellings of one room the last
+        # one listed wins, in the position of the room's first spelling
+        listed = set()
+        seen_rooms = {}
+        for pattern in _ROOM_PATTERNS:
+            for match in pattern.findall(text):  # Case-insensitive matching
+                if match in listed:
+                    continue
+                name = match.strip()  # Clean whitespace
+                listed.add(name)
+                seen_rooms[name.lower()] = name
 
         # Extract and process coordinate data from all coordinate patterns
         all_coords = []
-        for coord_pattern in coord_patterns:
-            matches = re.findall(coord_pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            for match in matches:
-                try:
-                    # Extract X, Y, Z coordinate values and convert to float
-                    x, y, z = float(match[0]), float(match[1]), float(match[2])
-                    
-                    # Unit conversion: check if pattern ends with "mm" (millimeter coordinates)
-                    if coord_pattern.endswith("mm"):
-                        # Convert millimeters to meters (divide by 1000)
-                        x, y, z = x/1000, y/1000, z/1000
-                    
-                    # Add coordinate to collection with proper units (always in meters)
-                    all_coords.append({"x_m": x, "y_m": y, "z_m": z})
-                except Exception:
-                    # Skip invalid coordinate matches (non-numeric values, conversion errors)
-                    continue
-
-        # Extract arrangement patterns from all arrangement regex patterns
-        arrangements = []
-        for pattern in arrangement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            arrangements.extend(matches)  # Collect all arrangement matches
+        for coord_pattern in _COORD_PATTERNS:
+            matches = coord_pattern.findall(text)  # Case-insensitive matching
+            if not matches:
+                continue
+            # Unit conversion: check if pattern ends with "mm" (millimeter coordinates)
+            in_mm = coord_pattern.pattern.endswith("mm")
+            if np is not None:
+                # Parse all X, Y, Z strings at once and convert mm to meters in one step
+                points = np.asarray(matches, dtype=np.float64)
+                if in_mm:
+                    points /= 1000
+                points = points.tolist()
+            else:
+                points = [[float(v) for v in match] for match in matches]
+                if in_mm:
+                    # Convert millimeters to meters (divide by 1000)
+                    points = [[v / 1000 for v in point] for point in points]
+
+            # Add coordinates to collection with proper units (always in meters)
+            all_coords.extend({"x_m": x, "y_m": y, "z_m": z} for x, y, z in points)
+
+        # Only the first arrangement is used: the first match of the first
+        # arrangement pattern that matches at all, or "A1" if none does
+        arrangement = "A1"
+        for pattern in _ARRANGEMENT_PATTERNS:
+            match = pattern.search(text)  # Case-insensitive matching
+            if match:
+                arrangement = match.group(1)
+                break
 
         # Assemble room data with extracted information
-        for room in all_rooms:
-            # Use first arrangement found, or default to "A1" if none found
-            arrangement = arrangements[0] if arrangements else "A1"
-            # Copy all coordinates to each room (shared layout assumption)
-            layout = all_coords.copy() if all_coords else []
-            
+        # Every room shares the one coordinate list (shared layout assumption);
+        # nothing modifies a room's layout afterwards, so it isn't copied per room
+        for name in seen_rooms.values():
             # Add complete room information to data structure
             data["rooms"].append({
-                "name": room["name"],           # Room name from pattern matching
+                "name": name,                   # Room name from pattern matching
                 "arrangement": arrangement,     # Arrangement pattern (e.g., "A1")
-                "layout": layout               # Coordinate layout points
+                "layout": all_coords            # Coordinate layout points
             })
 
         # Fallback: create default room if no rooms were found
@@ -513,20 +785,14 @@ class FinalPDFExtractor:
             data["rooms"].append({
                 "name": "Building 1 · Storey 1 · Room 1",  # Default room name
                 "arrangement": "A1",                        # Default arrangement
-                "layout": all_coords if all_coords else []  # Use any found coordinates
+                "layout": all_coords                        # Use any found coordinates
             })
-        
-        # Deduplicate rooms by name (case-insensitive)
-        # This prevents duplicate room entries from multiple pattern matches
-        unique = {}
-        for r in data["rooms"]:
-            unique[r["name"].lower()] = r  # Use lowercase name as key for deduplication
-        data["rooms"] = list(unique.values())  # Convert back to list of unique rooms
 
     # -----------------------------------------------------
     # SCENE EXTRACTION
     # -----------------------------------------------------
-    def _extract_scenes(self, text: str, data: Dict[str, Any]):
+    def _extract_scenes(self, text: str, data: Dict[str, Any],
+                        candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract scene information from the PDF text.
         
@@ -538,6 +804,7 @@ class FinalPDFExtractor:
         Args:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with scene info
+            candidates: Patterns that passed the prefilter (None runs them all)
         """
         # Scene extraction with optional scene name and comprehensive metrics
         # Pattern matches: "Scene Name 673 lx 277 lx 949 lx 0.41 0.49 CG6"
@@ -548,10 +815,7 @@ class FinalPDFExtractor:
         # Group 5: Uniformity ratio (e.g., "0.41")
         # Group 6: G1 index value (e.g., "0.49")
         # Group 7: Lighting class index (e.g., "CG6")
-        scene_matches = re.findall(
-            r"(?:([A-Za-z ]+)\s+)?([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s*lx\s+([\d.]+)\s+([\d.]+)\s+([A-Za-z0-9]+)",
-            text
-        )
+        scene_matches = _find_scenes(text) if may_match(_SCENE_RE, candidates) else []
 
         # Process each matched scene specification
         for sm in scene_matches:
@@ -625,13 +889,16 @@ class FinalPDFExtractor:
             "scenes": []                  # Lighting scene performance data
         }
 
+        # One Hyperscan pass rules out field patterns that can't match
+        candidates = candidate_patterns(text, _PREFILTER_DB, _PREFILTERED_RES)
+
         # Execute all extraction methods in sequence
         # Each method populates its respective section of the data structure
-        self._extract_metadata(text, data)           # Extract basic report information
-        self._extract_lighting_setup(text, data)     # Extract lighting system configuration
-        self._extract_luminaires(text, data)         # Extract fixture specifications
-        self._extract_rooms(text, data)              # Extract room layouts and coordinates
-        self._extract_scenes(text, data)             # Extract scene performance data
+        self._extract_metadata(text, data)                       # Extract basic report information
+        self._extract_lighting_setup(text, data, candidates)     # Extract lighting system configuration
+        self._extract_luminaires(text, data, candidates)         # Extract fixture specifications
+        self._extract_rooms(text, data)                          # Extract room layouts and coordinates
+        self._extract_scenes(text, data, candidates)             # Extract scene performance data
 
         return data
 
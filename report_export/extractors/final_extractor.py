@@ -14,13 +14,263 @@ Version: 1.0
 """
 
 import pdfplumber
-from pdf2image import convert_from_path
-import pytesseract
+from PIL import Image
 import re
 import json
 import os
-from typing import Dict, Any
+import glob
+import argparse
+import faulthandler
+import atexit
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Dict, Any, Iterable, List, Optional, Set
 import sys
+
+if __package__:
+    from ._shared_cache import CACHE_DIR, cache_read, cache_write, file_digest, parser_fingerprint
+    from ._shared_sections import build_prefilter, candidate_patterns, may_match
+else:
+    # Run as a script from inside extractors/
+    from _shared_cache import CACHE_DIR, cache_read, cache_write, file_digest, parser_fingerprint
+    from _shared_sections import build_prefilter, candidate_patterns, may_match
+
+try:
+    # Optional; the fastest text extractor, imported once rather than per PDF
+    import fitz
+except ImportError:
+    fitz = None
+
+try:
+    # Optional; PDFium's text extraction, a fast fallback that skips pdfminer.six
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional; several times faster than json.dump for the result file
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# -----------------------------------------------------
+# RESULT CACHE
+# -----------------------------------------------------
+# process_report() results are cached on disk keyed by a hash of the PDF's
+# bytes (and of the aliases used to parse it), so reprocessing an unchanged
+# file skips extraction and parsing entirely. The helpers and CACHE_DIR are
+# in _shared_cache.py.
+_RESULT_CACHE_SUFFIX = ".final.json"
+
+# Results are also keyed on the parser source, so editing the parser
+# invalidates them
+_PARSER_FINGERPRINT = parser_fingerprint(__file__)
+
+
+# -----------------------------------------------------
+# TEXT BACKENDS
+# -----------------------------------------------------
+# Names accepted by FinalPDFExtractor(backend=...) and the --backend option,
+# in the default order of self.text_extractors
+TEXT_BACKENDS = ("pymupdf", "pdfium", "pdfplumber")
+
+
+# -----------------------------------------------------
+# PARALLEL PYMUPDF EXTRACTION
+# -----------------------------------------------------
+# PyMuPDF handles a page in a few milliseconds, so worker processes only pay
+# for themselves on long documents
+PYMUPDF_PARALLEL_MIN_PAGES = 64
+
+
+def _pymupdf_page_block(pdf_path: str, first: int, last: int) -> List[str]:
+    """
+    Page texts of pages first..last-1 (0-based), for a pool worker.
+    
+    fitz documents can't be pickled, so each worker opens its own.
+    """
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text("text") for i in range(first, last)]
+
+
+# -----------------------------------------------------
+# SCANNED PDF DETECTION
+# -----------------------------------------------------
+# A page with under SCANNED_PROBE_MIN_CHARS characters of text, mostly
+# covered (over SCANNED_IMAGE_COVERAGE of its area) by one image, is a scan.
+# A PDF is treated as scanned when its first SCANNED_PROBE_PAGES pages all
+# are, so a text report behind a scanned cover page isn't OCR'd whole
+SCANNED_PROBE_MIN_CHARS = 50
+SCANNED_IMAGE_COVERAGE = 0.8
+SCANNED_PROBE_PAGES = 3
+
+
+def _looks_scanned(doc) -> bool:
+    """Guess from the first pages of an open PyMuPDF document whether it is a scan without a text layer"""
+    if len(doc) == 0:
+        return False
+    return all(_page_looks_scanned(doc[i]) for i in range(min(len(doc), SCANNED_PROBE_PAGES)))
+
+
+def _page_looks_scanned(page) -> bool:
+    """True for a page with almost no text that is mostly one image"""
+    if len(page.get_text("text").strip()) >= SCANNED_PROBE_MIN_CHARS:
+        return False
+    page_area = abs(page.rect)
+    if not page_area:
+        return False
+    for info in page.get_image_info():
+        covered = abs(fitz.Rect(info["bbox"]) & page.rect)
+        if covered / page_area > SCANNED_IMAGE_COVERAGE:
+            return True
+    return False
+
+
+# -----------------------------------------------------
+# OCR SETTINGS
+# -----------------------------------------------------
+OCR_DPI = 300
+# Page segmentation mode 6 reads each page as one uniform block of text,
+# skipping most of Tesseract's layout analysis and keeping table rows on
+# one line
+OCR_CONFIG = "--psm 6"
+# pytesseract writes the image to a temp file for Tesseract in image.format,
+# PNG when unset. Uncompressed PNM (pdf2image's own format) is written in
+# milliseconds; PNG's zlib pass takes most of a second per page at OCR_DPI
+OCR_IMAGE_FORMAT = "PPM"
+
+
+def _ocr_image(image) -> str:
+    """Tesseract on one page image; module-level so OCR pool workers can run it"""
+    # Imported on first use: only scanned PDFs need OCR
+    import pytesseract
+    image.format = OCR_IMAGE_FORMAT
+    return pytesseract.image_to_string(image, config=OCR_CONFIG)
+
+
+# -----------------------------------------------------
+# PRECOMPILED PATTERNS
+# -----------------------------------------------------
+# Compiled once at import time so the _extract_* methods never recompile a
+# pattern or go through re's internal pattern cache on each call
+
+# _safe_float number cleanup
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_PLAIN_NUMBER_RE = re.compile(r'^\d+(\.\d+)?$')
+
+# Company name patterns, tried in order
+# Pattern 1: Matches "Company", "Short Cicuit", or "Short Circuit" followed by any text until newline or end
+# Pattern 2: Matches "Company Name:" or "Company Name-" followed by the actual name
+# Pattern 3: Exact match for "Short Cicuit Company" (common typo in reports)
+_COMPANY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",  # Flexible company name matching
+    r"Company\s*Name[:\-]?\s*(.+)",  # Structured company name field
+    r"Short\s*Cicuit\s*Company"  # Exact match for known company name
+))
+# First-page lines that are headings rather than the project name
+_PROJECT_SKIP_RE = re.compile(r"(?i)description|images|technical|company|ico")
+# "Eng." followed by engineer's name (common format in reports)
+_ENGINEER_RE = re.compile(r"Eng\.\s*[A-Za-z ]+")
+# Standard email format: username@domain.com
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
+
+# Lighting setup: a number with "," or "." decimals, and the units after it
+_NUMBER_PATTERN = r"([0-9]+(?:[.,][0-9]+)?)"
+_EFFICACY_UNIT_RE = re.compile(r"\blm/?w\b")
+_WATT_UNIT_RE = re.compile(r"\bw(att)?s?\b")
+# Compact DIALux-like line with numbers (avg, min, max, Uo, g1, index)
+_COMPACT_SETUP_RE = re.compile(
+    rf"(?:(?:Ē|Eavg|Average|E)\s*[:=]?\s*)?{_NUMBER_PATTERN}\s*lx?"
+    rf"[\s\n]+(?:(?:Emin|Min)?\s*[:=]?\s*)?{_NUMBER_PATTERN}\s*lx?"
+    rf"[\s\n]+(?:(?:Emax|Max)?\s*[:=]?\s*)?{_NUMBER_PATTERN}\s*lx?"
+    rf"[\s\n]+{_NUMBER_PATTERN}"
+    rf"[\s\n]+{_NUMBER_PATTERN}"
+    rf"[\s\n]+([A-Za-z0-9]+)",
+    re.UNICODE
+)
+
+# Luminaire list section, its Φtotal summary, and one row per luminaire
+_LUMINAIRE_SECTION_RE = re.compile(
+    r"Luminaire list[\s\S]+?(?=Calculation surface|Room|$)",
+    flags=re.IGNORECASE,
+)
+_LUMINAIRE_TOTAL_RE = re.compile(
+    r"Φtotal.*?([\d.,]+)\s*lm.*?([\d.,]+)\s*W.*?([\d.,]+)\s*lm/W",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_LUMINAIRE_ROW_RE = re.compile(
+    r"(\d+)\s+([A-Za-z]+)\s+([\w\-\/]+)\s+([A-Za-z0-9\s\-\+x\/]+?)\s+([\d.,]+)\s*(?:W|\[W\]|\(W\))\s+([\d.,]+)\s*(?:lm|\[lm\]|\(lm\))\s+([\d.,]+)\s*(?:lm/W|\[lm/W\]|\(lm/W\))",
+    flags=re.IGNORECASE,
+)
+
+# Layout tables following any header with X/Y/height, their arrangement
+# label, and coordinate rows of 3 float+m values
+_LAYOUT_TABLE_RE = re.compile(
+    r"(?:X\s*Y\s*Mounting\s*height[\s\S]+?)(?=(?:Arrangement|Luminaire list|Building|$))",
+    re.IGNORECASE
+)
+# Arrangement label of a layout table ("Arrangement A1"); the word boundary
+# keeps "Field Arrangement 1st luminaire..." from reading as arrangement "1"
+_LAYOUT_ARRANGEMENT_RE = re.compile(r"Arrangement\s+([A-Z]?\d+)\b", re.IGNORECASE)
+_LAYOUT_COORD_RE = re.compile(r"(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m")
+
+# Room name patterns - multiple formats to handle different naming conventions
+# Pattern 1: "Building 1 · Storey 1 · Room 1" (with bullet separators)
+# Pattern 2: "Building 1 Storey 1 Room 1" (with space separators)
+# Pattern 3: "Room 1" (simple room number)
+# Pattern 4: "Building 1 ... Room 1" (flexible building-room format)
+_ROOM_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",  # Bullet-separated format
+    r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",           # Space-separated format
+    r"(Room\s*\d+)",                                           # Simple room number
+    r"(Building\s*\d+.*?Room\s*\d+)"                          # Flexible building-room format
+))
+
+# Arrangement patterns - multiple formats to handle different arrangement labels
+# Pattern 1: "Arrangement: A1" or "Arrangement - A1"
+# Pattern 2: "Layout: A1" or "Layout - A1"
+# Pattern 3: "Pattern: A1" or "Pattern - A1"
+# Pattern 4: "A1 arrangement" (reverse format)
+_ARRANGEMENT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",  # Standard arrangement label
+    r"Layout[:\-]?\s*([A-Za-z0-9]+)",       # Layout label variant
+    r"Pattern[:\-]?\s*([A-Za-z0-9]+)",      # Pattern label variant
+    r"([A-Za-z0-9]+)\s*arrangement"         # Reverse arrangement format
+))
+
+# Room names are deduplicated on their letters and digits only
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+# Scene tables: [Scene Name] [Average Lux] [Min Lux] [Max Lux] [Uniformity] [G1] [Index]
+# Supports various label forms (e.g., Ē, Eavg, Average, E) and optional scene names
+_SCENE_RE = re.compile(
+    r"(?:([A-Za-z ]+)\s+)?"
+    r"(?:(?:Ē|Eavg|Average|E)\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Average lux
+    r"[\s\n]+(?:(?:Emin|Min)?\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Min lux
+    r"[\s\n]+(?:(?:Emax|Max)?\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Max lux
+    r"[\s\n]+([\d.]+)"                                         # Uniformity (Uo)
+    r"[\s\n]+([\d.]+)"                                         # G1 (glare index)
+    r"[\s\n]+([A-Za-z0-9]+)",                                  # Index (e.g., CG1)
+    re.UNICODE
+)
+
+# Section patterns screened together in one Hyperscan pass per report, so the
+# extractors never run a pattern that can't match (no-op without Hyperscan)
+_PREFILTERED_RES = (
+    _COMPACT_SETUP_RE, _LUMINAIRE_SECTION_RE, _LAYOUT_TABLE_RE, _LAYOUT_ARRANGEMENT_RE,
+    _LAYOUT_COORD_RE, _SCENE_RE,
+) + _ROOM_PATTERNS + _ARRANGEMENT_PATTERNS
+_PREFILTER_DB = build_prefilter(_PREFILTERED_RES)
     
 
 # class FinalPDFExtractor:
@@ -47,7 +297,7 @@ class FinalPDFExtractor:
     - Robust error handling and logging
     
     Features:
-    - Hybrid text extraction (pdfplumber + PyMuPDF + OCR fallback)
+    - Hybrid text extraction (PyMuPDF + pypdfium2 + pdfplumber + OCR fallback)
     - Advanced room layout extraction with multiple coordinate formats
     - Alias-based field mapping for better recognition
     - Comprehensive luminaire and scene extraction
@@ -60,26 +310,47 @@ class FinalPDFExtractor:
         """
         if value_str is None:
             return None
+        if isinstance(value_str, str):
+            # Fast path for already-clean numbers ("150", "150.0"), which the
+            # cleanup below would leave unchanged
+            head, dot, tail = value_str.partition('.')
+            if head.isdigit() and (not dot or tail.isdigit()):
+                try:
+                    return float(value_str)
+                except ValueError:
+                    pass  # e.g. superscript digits; let the cleanup decide
         s = str(value_str).strip()
         # convert comma decimal separators to dot (and remove thousands separators if present)
         s = s.replace(',', '.')
         # remove any characters that are not digits or dot
-        s = re.sub(r'[^\d.]', '', s)
+        s = _NON_NUMERIC_RE.sub('', s)
         # reject empty or a lone dot
-        if not re.match(r'^\d+(\.\d+)?$', s):
+        if not _PLAIN_NUMBER_RE.match(s):
             return None
         try:
             return float(s)
         except Exception:
             return None
 
-    def __init__(self, alias_file: str = "aliases.json"):
+    def __init__(self, alias_file: str = "aliases.json", backend: Optional[str] = None, ocr: bool = True):
         """
         Initialize the Final PDF Extractor.
         Supports both external alias file and built-in defaults.
+        
+        Args:
+            alias_file (str): Alias JSON file, relative to this directory
+            backend (str): Text extractor to try first, one of TEXT_BACKENDS
+                (default: the order of self.text_extractors below)
+            ocr (bool): Fall back to OCR when no text layer is found
         """
+        if backend is not None and backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(TEXT_BACKENDS)}")
+        self.backend = backend
+        self.ocr = ocr
+
         base_dir = os.path.dirname(os.path.abspath(__file__))
         alias_path = os.path.join(base_dir, alias_file)
+        self.alias_path = alias_path  # worker processes load the same aliases
 
         # Default aliases (used if JSON missing or broken)
         default_aliases = {
@@ -111,18 +382,96 @@ class FinalPDFExtractor:
             if os.path.exists(alias_path):
                 with open(alias_path, "r", encoding="utf-8") as f:
                     self.aliases = json.load(f)
-                print(f"✓ Loaded aliases from {alias_path}")
+                logger.info(f"✓ Loaded aliases from {alias_path}")
             else:
                 raise FileNotFoundError
         except Exception as e:
-            print(f"⚠️ Using default aliases (reason: {e})")
+            logger.warning(f"⚠️ Using default aliases (reason: {e})")
             self.aliases = default_aliases
 
-        # Text extractors
+        # Reverse lookups (lowercased alias -> canonical name), built once so
+        # normalization is a single dict hit; the first canonical name listing
+        # an alias wins, as with the original in-order scan
+        self._param_lookup = self._build_lookup(self.aliases["parameters"])
+        self._place_lookup = self._build_lookup(self.aliases["places"])
+
+        # On-disk cache of process_report() results (None or "" disables it).
+        # The aliases and text settings are part of the key, with the parser
+        # source (_PARSER_FINGERPRINT): changing them changes the results
+        self.cache_dir = CACHE_DIR
+        self._settings_digest = hashlib.blake2b(
+            json.dumps([self.aliases, backend, ocr], sort_keys=True).encode("utf-8"), digest_size=8
+        ).hexdigest()
+
+        # Worker processes one PDF's extraction may start (PyMuPDF page blocks,
+        # OCR pages). Set to 1 where the extractor already runs in a pool
+        # worker, so the pools don't multiply to workers x CPUs processes
+        self.workers = os.cpu_count() or 1
+
+        # Text extractors, tried in order. PyMuPDF is many times faster than
+        # pdfplumber (pdfminer.six) on text, so it goes first; reorder this
+        # list to prefer pdfplumber's text
         self.text_extractors = [
-            self._extract_with_pdfplumber,
-            self._extract_with_pymupdf
+            self._extract_with_pymupdf,
+            self._extract_with_pypdfium2,
+            self._extract_with_pdfplumber
         ]
+        if backend is not None:
+            # The requested backend first; the others stay as fallbacks
+            preferred = self.text_extractors.pop(TEXT_BACKENDS.index(backend))
+            self.text_extractors.insert(0, preferred)
+
+        # Documents opened for the PDF that process_report() is working on,
+        # keyed by (library, path) and shared until it finishes (see _pdf_session)
+        self._session_path = None
+        self._open_docs = {}
+
+        # Alias-driven patterns, compiled on first use (see _get_*_alias_patterns)
+        self._lighting_alias_patterns = None
+        self._lighting_alias_scan = None
+        self._scene_alias_patterns = None
+
+    # -----------------------------------------------------
+    # SHARED PDF HANDLES
+    # -----------------------------------------------------
+    @contextmanager
+    def _pdf_session(self, pdf_path: str):
+        """
+        Share documents opened through _open_pdf() for pdf_path until the
+        session ends, so each library parses the file (xref, page tree) once
+        per report instead of once per extractor.
+        """
+        if self._session_path is not None:
+            yield  # nested; the outer session owns the documents
+            return
+        self._session_path = pdf_path
+        try:
+            yield
+        finally:
+            self._session_path = None
+            docs, self._open_docs = self._open_docs, {}
+            for doc in docs.values():
+                doc.close()
+
+    @contextmanager
+    def _open_pdf(self, library: str, pdf_path: str):
+        """
+        Yield pdf_path opened with "fitz" or "pdfplumber".
+        
+        Inside a _pdf_session() for the same file the document is shared and
+        stays open; otherwise it is opened here and closed afterwards.
+        """
+        shared = self._session_path == pdf_path
+        doc = self._open_docs.get((library, pdf_path)) if shared else None
+        if doc is None:
+            doc = fitz.open(pdf_path) if library == "fitz" else pdfplumber.open(pdf_path)
+            if shared:
+                self._open_docs[(library, pdf_path)] = doc
+        try:
+            yield doc
+        finally:
+            if not shared:
+                doc.close()
 
     # -----------------------------------------------------
     # TEXT EXTRACTION METHODS
@@ -131,8 +480,8 @@ class FinalPDFExtractor:
         """
         Extract text from PDF using pdfplumber library.
         
-        This is the primary text extraction method as it's fast and accurate
-        for text-based PDFs. It preserves formatting and handles most PDF types well.
+        This is the fallback text extraction method; it's slower than PyMuPDF
+        but accurate for text-based PDFs and handles most PDF types well.
         
         Args:
             pdf_path (str): Path to the PDF file to extract text from
@@ -140,23 +489,27 @@ class FinalPDFExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        # Pages are collected and joined once at the end; growing one string
+        # with += copies the whole text so far for every page of a big report
+        parts = []
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with self._open_pdf("pdfplumber", pdf_path) as pdf:
                 for page in pdf.pages:
-                    if page.extract_text():
-                        text += page.extract_text() + "\n"
+                    # extract_text() rebuilds the page's text layout on every call
+                    page_text = page.extract_text()
+                    if page_text:
+                        parts.append(page_text + "\n")
         except Exception as e:
-            print(f"pdfplumber error: {e}")
-        return text.strip()
+            logger.error(f"pdfplumber error: {e}")
+        return "".join(parts).strip()
 
     def _extract_with_pymupdf(self, pdf_path: str) -> str:
         """
         Extract text from PDF using PyMuPDF (fitz) library.
         
-        This is an alternative text extraction method that can handle
-        some PDF types that pdfplumber might struggle with. It's used
-        as a fallback when pdfplumber fails.
+        This is the primary text extraction method: MuPDF's C text extraction
+        is much faster than pdfplumber's. pdfplumber is used when PyMuPDF
+        isn't installed or returns too little text.
         
         Args:
             pdf_path (str): Path to the PDF file to extract text from
@@ -164,24 +517,67 @@ class FinalPDFExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        if fitz is None:
+            return ""
+        parts = []
         try:
-            import fitz
-            doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text() + "\n"
-            doc.close()
+            cpus = self.workers
+            with self._open_pdf("fitz", pdf_path) as doc:
+                n_pages = len(doc)
+                parallel = cpus > 1 and n_pages >= PYMUPDF_PARALLEL_MIN_PAGES
+                if not parallel:
+                    parts = [page.get_text("text") for page in doc]
+            if parallel:
+                # Long document: one contiguous block of pages per worker,
+                # reassembled in page order
+                block = -(-n_pages // cpus)
+                starts = range(0, n_pages, block)
+                ends = [min(start + block, n_pages) for start in starts]
+                with ProcessPoolExecutor(max_workers=len(ends)) as executor:
+                    for block_parts in executor.map(_pymupdf_page_block, repeat(pdf_path), starts, ends):
+                        parts.extend(block_parts)
         except Exception as e:
-            print(f"PyMuPDF error: {e}")
-        return text.strip()
+            logger.error(f"PyMuPDF error: {e}")
+        return "\n".join(parts).strip()
+
+    def _extract_with_pypdfium2(self, pdf_path: str) -> str:
+        """
+        Extract text from PDF using pypdfium2 (PDFium) library.
+        
+        Used when PyMuPDF isn't available or fails. PDFium's range-based text
+        extraction is much faster than pdfplumber's pdfminer.six parser.
+        
+        Args:
+            pdf_path (str): Path to the PDF file to extract text from
+            
+        Returns:
+            str: Extracted text content, or empty string if extraction fails
+        """
+        if pypdfium2 is None:
+            return ""
+        parts = []
+        try:
+            pdf = pypdfium2.PdfDocument(pdf_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    parts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.error(f"pypdfium2 error: {e}")
+        # PDFium ends lines with \r\n; the patterns expect \n
+        return "\n".join(parts).replace("\r\n", "\n").strip()
 
     def _ocr_pdf(self, pdf_path: str) -> str:
         """
         Extract text from PDF using OCR (Optical Character Recognition).
         
         This method is used as a fallback when text-based extraction fails.
-        It converts PDF pages to images and uses Tesseract OCR to extract text.
+        It converts PDF pages to images (with PyMuPDF, or pdf2image without it)
+        and uses Tesseract OCR to extract text.
         This is slower but can handle scanned PDFs and image-based documents.
         
         Args:
@@ -190,23 +586,79 @@ class FinalPDFExtractor:
         Returns:
             str: OCR extracted text content, or empty string if extraction fails
         """
-        text = ""
+        parts = []
         try:
-            pages = convert_from_path(pdf_path, dpi=300)
-            for page in pages:
-                text += pytesseract.image_to_string(page) + "\n"
+            if fitz is not None:
+                # Render one page at a time in-process, in grayscale (a third of
+                # the bytes of RGB; Tesseract binarizes anyway). pdf2image would
+                # run pdftoppm and hold every page image in memory at once
+                with self._open_pdf("fitz", pdf_path) as doc:
+                    images = (
+                        Image.frombytes("L", (pix.width, pix.height), pix.samples)
+                        for pix in (page.get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY) for page in doc)
+                    )
+                    parts = [page_text + "\n" for page_text in self._ocr_images(images, len(doc))]
+            else:
+                # Imported here; the OCR packages aren't needed for text PDFs
+                from pdf2image import convert_from_path
+                pages = convert_from_path(pdf_path, dpi=OCR_DPI, thread_count=self.workers)
+                parts = [page_text + "\n" for page_text in self._ocr_images(pages, len(pages))]
         except Exception as e:
-            print(f"OCR error: {e}")
-        return text.strip()
+            logger.error(f"OCR error: {e}")
+        return "".join(parts).strip()
+
+    def _is_scanned(self, pdf_path: str) -> bool:
+        """
+        _looks_scanned() on the PDF's first pages. Only PyMuPDF is fast enough
+        for this probe; without it (or if the file can't be opened) the answer
+        is False and the normal fallback chain runs.
+        """
+        if fitz is None:
+            return False
+        try:
+            with self._open_pdf("fitz", pdf_path) as doc:
+                return _looks_scanned(doc)
+        except Exception as e:
+            logger.error(f"PyMuPDF error: {e}")
+            return False
+
+    def _ocr_images(self, images: Iterable, n_pages: int) -> List[str]:
+        """
+        OCR page images in order, spread over worker processes.
+        
+        Tesseract is CPU-bound, so pages go to a pool of one process per CPU
+        (self.workers) but one (that one keeps rendering pages). At most two
+        pages per worker are queued, so images are produced only as fast as
+        they are consumed.
+        """
+        workers = min(max(1, self.workers - 1), n_pages)
+        if workers <= 1:
+            return [_ocr_image(image) for image in images]
+        texts = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for image in images:
+                pending.append(executor.submit(_ocr_image, image))
+                if len(pending) >= 2 * workers:
+                    texts.append(pending.popleft().result())
+            while pending:
+                texts.append(pending.popleft().result())
+        return texts
 
     def extract_text(self, pdf_path: str) -> str:
         """
         Extract text from PDF using a fallback chain of methods.
         
-        This method tries multiple extraction approaches in order of preference:
-        1. pdfplumber (fastest, best for text-based PDFs)
-        2. PyMuPDF (alternative text extraction)
-        3. OCR (slowest, but works with scanned PDFs)
+        This method tries multiple extraction approaches in order of preference
+        (see self.text_extractors):
+        1. PyMuPDF (fastest, best for text-based PDFs)
+        2. pypdfium2 (fast alternative text extraction)
+        3. pdfplumber (slowest text extraction, but the most widely installed)
+        4. OCR (slowest, but works with scanned PDFs)
+        
+        A PDF whose first pages are scanned images (see _is_scanned) goes
+        to OCR first, skipping text extractors that would find nothing. With
+        self.ocr off, the text extractors' best effort is returned instead.
         
         Args:
             pdf_path (str): Path to the PDF file to extract text from
@@ -214,11 +666,20 @@ class FinalPDFExtractor:
         Returns:
             str: Extracted text content from the most successful method
         """
+        ocr_text = None
+        if self.ocr and self._is_scanned(pdf_path):
+            logger.info("First pages are scanned images; trying OCR first")
+            ocr_text = self._ocr_pdf(pdf_path)
+            if len(ocr_text) > 50:
+                return ocr_text
         for extractor in self.text_extractors:
             text = extractor(pdf_path)
             if text and len(text) > 50:
                 return text
-        return self._ocr_pdf(pdf_path)
+        if not self.ocr:
+            return text
+        # Don't OCR the same PDF twice
+        return ocr_text if ocr_text is not None else self._ocr_pdf(pdf_path)
 
     # def process_report(self, pdf_path: str) -> Dict[str, Any]:
     #     """
@@ -249,6 +710,15 @@ class FinalPDFExtractor:
     # -----------------------------------------------------
     # NORMALIZATION USING ALIASES
     # -----------------------------------------------------
+    @staticmethod
+    def _build_lookup(alias_groups: Dict[str, Any]) -> Dict[str, str]:
+        """Invert {canonical: [aliases]} into {lowercased alias: canonical}"""
+        lookup = {}
+        for standard, variations in alias_groups.items():
+            for v in variations:
+                lookup.setdefault(v.lower(), standard)
+        return lookup
+
     def normalize_parameter(self, param: str) -> str:
         """
         Normalize parameter names using the alias mapping system.
@@ -263,10 +733,7 @@ class FinalPDFExtractor:
             str: The normalized parameter name, or original if no mapping found
         """
         param = param.lower().strip()
-        for standard, variations in self.aliases["parameters"].items():
-            if param in [v.lower() for v in variations]:
-                return standard
-        return param
+        return self._param_lookup.get(param, param)
 
     def normalize_place(self, place: str) -> str:
         """
@@ -282,10 +749,95 @@ class FinalPDFExtractor:
             str: The normalized place name, or original if no mapping found
         """
         place = place.lower().strip()
-        for standard, variations in self.aliases["places"].items():
-            if place in [v.lower() for v in variations]:
-                return standard
-        return place
+        return self._place_lookup.get(place, place)
+
+    def _get_lighting_alias_patterns(self) -> Dict[str, List[tuple]]:
+        """
+        (alias, compiled pattern) pairs per standard parameter for
+        _extract_lighting_setup, compiled once per extractor on first use.
+        """
+        if self._lighting_alias_patterns is None:
+            self._lighting_alias_patterns = {
+                standard: [
+                    # Use boundaries to avoid partial-word matches (e.g., 'lm' in 'film')
+                    # Match number + optional unit right after
+                    (alias, re.compile(
+                        rf"(?<!\w){re.escape(alias)}(?!\w)\s*[:=]?\s*{_NUMBER_PATTERN}\s*([A-Za-z/]+)?",
+                        re.IGNORECASE | re.UNICODE,
+                    ))
+                    for alias in variations
+                ]
+                for standard, variations in self.aliases.get("parameters", {}).items()
+            }
+        return self._lighting_alias_patterns
+
+    def _get_lighting_alias_scan(self):
+        """
+        Scan regex over the positions where any lighting alias can start,
+        plus the alias patterns bucketed by their lowercased first character.
+        Empty aliases can't be bucketed and are returned separately.
+        """
+        if self._lighting_alias_scan is None:
+            buckets: Dict[str, List[tuple]] = {}
+            unbucketed = []
+            for patterns in self._get_lighting_alias_patterns().values():
+                for alias, pattern in patterns:
+                    if alias:
+                        bucket = buckets.setdefault(alias[0].lower(), [])
+                        if (alias, pattern) not in bucket:
+                            bucket.append((alias, pattern))
+                    else:
+                        unbucketed.append((alias, pattern))
+            first_chars = "".join(re.escape(c) for c in buckets)
+            # Same boundary and case folding as the alias patterns, so every
+            # position an alias pattern can match at is a scan hit
+            scan_re = re.compile(rf"(?<!\w)[{first_chars}]", re.IGNORECASE | re.UNICODE) if buckets else None
+            self._lighting_alias_scan = (scan_re, buckets, unbucketed)
+        return self._lighting_alias_scan
+
+    def _first_alias_matches(self, text: str) -> Dict[str, re.Match]:
+        """
+        First match of every lighting alias pattern in text, from one pass.
+
+        The alias patterns are only tried at the scan hits, against the aliases
+        whose first character folds to the one in the text; characters whose
+        lower() isn't a bucket key (e.g. 'ſ' or 'İ', which IGNORECASE still
+        folds onto ASCII) try every alias. Each alias keeps its earliest hit,
+        the same match pattern.search(text) returns.
+        """
+        scan_re, buckets, unbucketed = self._get_lighting_alias_scan()
+        found = {alias: pattern.search(text) for alias, pattern in unbucketed}
+        if scan_re is None:
+            return found
+        pending = {c: list(bucket) for c, bucket in buckets.items()}
+        remaining = sum(len(bucket) for bucket in pending.values())
+        for hit in scan_re.finditer(text):
+            pos = hit.start()
+            key = text[pos].lower()
+            tried = [pending[key]] if key in pending else list(pending.values())
+            for bucket in tried:
+                for entry in list(bucket):
+                    alias, pattern = entry
+                    m = pattern.match(text, pos)
+                    if m:
+                        found[alias] = m
+                        bucket.remove(entry)
+                        remaining -= 1
+            if not remaining:
+                break
+        return found
+
+    def _get_scene_alias_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """
+        Compiled "<alias> <number>" patterns per standard parameter for the
+        _extract_scenes fallback, compiled once per extractor on first use.
+        """
+        if self._scene_alias_patterns is None:
+            self._scene_alias_patterns = {
+                standard: [re.compile(rf"{alias}\s*[:=]?\s*([\d.]+)", re.IGNORECASE) for alias in variations]
+                for standard, variations in self.aliases["parameters"].items()
+            }
+        return self._scene_alias_patterns
 
     # -----------------------------------------------------
     # METADATA EXTRACTION
@@ -303,17 +855,9 @@ class FinalPDFExtractor:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with extracted metadata
         """
-        # Company name extraction with multiple pattern matching
-        # Pattern 1: Matches "Company", "Short Cicuit", or "Short Circuit" followed by any text until newline or end
-        # Pattern 2: Matches "Company Name:" or "Company Name-" followed by the actual name
-        # Pattern 3: Exact match for "Short Cicuit Company" (common typo in reports)
-        company_patterns = [
-            r"(Company|Short\s*Cicuit|Short\s*Circuit).*?(?=\n|$)",  # Flexible company name matching
-            r"Company\s*Name[:\-]?\s*(.+)",  # Structured company name field
-            r"Short\s*Cicuit\s*Company"  # Exact match for known company name
-        ]
-        for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)  # Case-insensitive matching
+        # Company name extraction with multiple pattern matching (see _COMPANY_PATTERNS)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(text)  # Case-insensitive matching
             if match:
                 data["metadata"]["company_name"] = match.group(0).strip()  # Clean whitespace
                 break  # Use first successful match
@@ -337,50 +881,46 @@ class FinalPDFExtractor:
         # --- Improved project name extraction ---
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with self._open_pdf("pdfplumber", pdf_path) as pdf:
                 first_page = pdf.pages[0]
                 first_text = first_page.extract_text().strip().splitlines()
                 # Take first non-empty, non-"Description" line
                 for line in first_text:
                     clean = line.strip()
-                    if clean and not re.match(r"(?i)description|images|technical|company|ico", clean):
+                    if clean and not _PROJECT_SKIP_RE.match(clean):
                         data["metadata"]["project_name"] = clean
                         break
         except Exception as e:
-            print("⚠️ Could not extract project name from first page:", e)
+            logger.warning(f"⚠️ Could not extract project name from first page: {e}")
 
         # Engineer name extraction
         # Matches "Eng." followed by engineer's name (common format in reports)
-        engineer_match = re.search(r"Eng\.\s*[A-Za-z ]+", text)
+        engineer_match = _ENGINEER_RE.search(text)
         if engineer_match:
             data["metadata"]["engineer"] = engineer_match.group(0).strip()  # Clean whitespace
 
         # Email address extraction
         # Matches standard email format: username@domain.com
         # Uses word characters, dots, and hyphens for username and domain
-        email_match = re.search(r"[\w\.-]+@[\w\.-]+", text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             data["metadata"]["email"] = email_match.group(0).strip()  # Clean whitespace
 
     # -----------------------------------------------------
     # LIGHTING SETUP EXTRACTION
     # -----------------------------------------------------
-    def _extract_lighting_setup(self, text: str, data: Dict[str, Any]):
+    def _extract_lighting_setup(self, text: str, data: Dict[str, Any],
+                                candidates: Optional[Set[re.Pattern]] = None):
         """Extract lighting setup values using aliases and robust fallbacks (supports Ē)."""
         lighting_setup = {}
 
-        number_pattern = r"([0-9]+(?:[.,][0-9]+)?)"
-
         # 1) Alias-driven extraction (safe, uses word boundaries)
-        params = self.aliases.get("parameters", {})
-        for standard, variations in params.items():
+        first_matches = self._first_alias_matches(text)
+        for standard, patterns in self._get_lighting_alias_patterns().items():
             if standard in lighting_setup:
                 continue
-            for alias in variations:
-                # Use boundaries to avoid partial-word matches (e.g., 'lm' in 'film')
-                # Match number + optional unit right after
-                pattern = rf"(?<!\w){re.escape(alias)}(?!\w)\s*[:=]?\s*{number_pattern}\s*([A-Za-z/]+)?"
-                m = re.search(pattern, text, re.IGNORECASE | re.UNICODE)
+            for alias, pattern in patterns:
+                m = first_matches.get(alias)
                 if m:
                     val = self._safe_float(m.group(1))
                     unit = (m.group(2) or "").lower().strip()
@@ -388,26 +928,18 @@ class FinalPDFExtractor:
                     # --- Intelligent unit handling ---
                     if val is not None:
                         # --- Explicit unit-based mapping ---
-                        if re.search(r"\blm/?w\b", unit) or "efficacy" in alias.lower():
+                        if _EFFICACY_UNIT_RE.search(unit) or "efficacy" in alias.lower():
                             lighting_setup["luminous_efficacy_lm_per_w"] = val
-                        elif re.search(r"\bw(att)?s?\b", unit):
+                        elif _WATT_UNIT_RE.search(unit):
                             lighting_setup["power_w"] = val
                         else:
                             lighting_setup[standard] = val
                     break
 
         # 2) Fallback: compact DIALux-like line with numbers (avg, min, max, Uo, g1, index)
-        if not lighting_setup.get("average_lux") or not lighting_setup.get("min_lux"):
-            compact = re.compile(
-                rf"(?:(?:Ē|Eavg|Average|E)\s*[:=]?\s*)?{number_pattern}\s*lx?"
-                rf"[\s\n]+(?:(?:Emin|Min)?\s*[:=]?\s*)?{number_pattern}\s*lx?"
-                rf"[\s\n]+(?:(?:Emax|Max)?\s*[:=]?\s*)?{number_pattern}\s*lx?"
-                rf"[\s\n]+{number_pattern}"
-                rf"[\s\n]+{number_pattern}"
-                rf"[\s\n]+([A-Za-z0-9]+)",
-                re.UNICODE
-            )
-            m = compact.search(text)
+        if (not lighting_setup.get("average_lux") or not lighting_setup.get("min_lux")) \
+                and may_match(_COMPACT_SETUP_RE, candidates):
+            m = _COMPACT_SETUP_RE.search(text)
             if m:
                 avg = self._safe_float(m.group(1))
                 emin = self._safe_float(m.group(2))
@@ -523,53 +1055,43 @@ class FinalPDFExtractor:
     #         if luminaire_data:
     #             data["luminaires"].append(luminaire_data)
 
-    def _extract_luminaires(self, text, data):
+    def _extract_luminaires(self, text, data, candidates=None):
         """
         Improved luminaire extractor that captures both per-luminaire entries
-        and the total summary block.
+        and the total summary block. candidates comes from candidate_patterns().
         """
         # --- Locate the luminaire section more flexibly ---
-        section_match = re.search(
-            r"Luminaire list[\s\S]+?(?=Calculation surface|Room|$)",
-            text,
-            flags=re.IGNORECASE,
-        )
+        section_match = _LUMINAIRE_SECTION_RE.search(text) if may_match(_LUMINAIRE_SECTION_RE, candidates) else None
         if not section_match:
-            print("⚠️ No 'Luminaire list' section found.")
+            logger.warning("⚠️ No 'Luminaire list' section found.")
             return
 
         section_text = section_match.group(0)
 
         # --- Extract total summary (bottom of section) ---
-        total_match = re.search(
-            r"Φtotal.*?([\d.,]+)\s*lm.*?([\d.,]+)\s*W.*?([\d.,]+)\s*lm/W",
-            section_text,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
+        total_match = _LUMINAIRE_TOTAL_RE.search(section_text)
         if total_match:
             data["lighting_setup"]["luminous_flux_total"] = self._safe_float(total_match.group(1))
             data["lighting_setup"]["power_w"] = self._safe_float(total_match.group(2))
             data["lighting_setup"]["luminous_efficacy_lm_per_w"] = self._safe_float(total_match.group(3))
 
         # --- Extract individual luminaire lines ---
-        luminaire_pattern = re.compile(
-            r"(\d+)\s+([A-Za-z]+)\s+([\w\-\/]+)\s+([A-Za-z0-9\s\-\+x\/]+?)\s+([\d.,]+)\s*(?:W|\[W\]|\(W\))\s+([\d.,]+)\s*(?:lm|\[lm\]|\(lm\))\s+([\d.,]+)\s*(?:lm/W|\[lm/W\]|\(lm/W\))",
-            flags=re.IGNORECASE,
-        )
-        matches = luminaire_pattern.findall(section_text)
+        matches = _LUMINAIRE_ROW_RE.findall(section_text)
         for m in matches:
             pcs, manuf, art_no, name, pw, lm, eff = m
             data["luminaires"].append({
                 "quantity": int(pcs),
-                "manufacturer": manuf,
-                "article_no": art_no,
+                # The same manufacturer/article repeats across rows; intern so
+                # every row shares one string object instead of its own copy
+                "manufacturer": sys.intern(manuf),
+                "article_no": sys.intern(art_no),
                 "article_name": name.strip(),
                 "power_w": self._safe_float(pw),
                 "luminous_flux_lm": self._safe_float(lm),
                 "luminous_efficacy_lm_per_w": self._safe_float(eff),
             })
 
-        print(f"✅ Extracted {len(data['luminaires'])} luminaires (including totals)")
+        logger.info(f"✅ Extracted {len(data['luminaires'])} luminaires (including totals)")
 
 
     # def _extract_layout(self, pdf_path: str):
@@ -650,57 +1172,65 @@ class FinalPDFExtractor:
     #         print(f"✓ Extracted {len(layout_coords)} layout points total")
     #     return layout_coords
 
-    def _extract_layout(self, text: str):
+    def _extract_layout(self, text: str, candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract luminaire layout coordinates (right-to-left scanning).
         Ensures X, Y, Z correspond correctly even when the Mounting height (Z)
         appears before X/Y visually in the report.
         """
-        layout_by_arr = {}
-        current_arr = "A1"
-
-        # Capture table blocks following any header with X/Y/height
-        table_pattern = re.compile(
-            r"(?:X\s*Y\s*Mounting\s*height[\s\S]+?)(?=(?:Arrangement|Luminaire list|Building|$))",
-            re.IGNORECASE
-        )
-        tables = table_pattern.findall(text)
-        total_points = 0
+        # Without a coordinate anywhere in the text there is no layout to find
+        if not may_match(_LAYOUT_COORD_RE, candidates):
+            logger.info("✅ Extracted 0 points across 0 arrangements (right-to-left layout parsing)")
+            return {}
 
-        for tbl in tables:
-            arr_match = re.search(r"Arrangement\s+([A-Z]?\d+)", tbl, re.IGNORECASE)
-            current_arr = arr_match.group(1).strip() if arr_match else f"A{len(layout_by_arr)+1}"
+        # Points per arrangement, keyed by (x, y, z) to drop duplicates as
+        # they are parsed (first one kept)
+        points_by_arr = {}
+        current_arr = None
 
-            coords = []
-            # match lines with 3 float+m values (order reversed: Z,Y,X)
-            for match in re.finditer(r"(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m", tbl):
-                # take values right-to-left (Z,Y,X)
-                z, y, x = map(float, match.groups()[::-1])
-                coords.append({"X": x, "Y": y, "Z": z})
-
-            if coords:
-                # remove duplicates while preserving order
-                seen = set()
-                unique = []
-                for c in coords:
-                    key = (c["X"], c["Y"], c["Z"])
-                    if key not in seen:
-                        seen.add(key)
-                        unique.append(c)
-                layout_by_arr[current_arr] = unique
-                total_points += len(unique)
+        # Capture table blocks following any header with X/Y/height
+        tables = _LAYOUT_TABLE_RE.finditer(text) if may_match(_LAYOUT_TABLE_RE, candidates) else ()
+        prev_end = 0
+
+        for tbl_match in tables:
+            tbl = tbl_match.group(0)
+            # The "Arrangement A1" label is inside the table in pdfplumber's
+            # row order, but just before the header in PyMuPDF's
+            arr_match = _LAYOUT_ARRANGEMENT_RE.search(tbl)
+            if not arr_match:
+                arr_match = next(reversed(list(
+                    _LAYOUT_ARRANGEMENT_RE.finditer(text, prev_end, tbl_match.start()))), None)
+            prev_end = tbl_match.end()
+            if arr_match:
+                current_arr = arr_match.group(1).strip()
+            elif current_arr is None:
+                current_arr = "A1"
+            # else: an unlabelled table continues the previous arrangement
+            # (its table split across a page break, with the header repeated)
+
+            # match lines with 3 float+m values (order reversed: Z,Y,X).
+            # findall hands back plain tuples, cheaper than a Match per row
+            unique = points_by_arr.setdefault(current_arr, {})
+            for row in _LAYOUT_COORD_RE.findall(tbl):
+                # right-to-left the values are Z, Y, X
+                x, y, z = float(row[0]), float(row[1]), float(row[2])
+                if (x, y, z) not in unique:
+                    unique[(x, y, z)] = {"X": x, "Y": y, "Z": z}
+
+        layout_by_arr = {arr: list(unique.values()) for arr, unique in points_by_arr.items() if unique}
+        total_points = sum(len(points) for points in layout_by_arr.values())
 
         # fallback if no arrangement tables found
         if not layout_by_arr:
-            coords = []
-            for match in re.finditer(r"(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m[^0-9]+(\d+\.\d+)\s*m", text):
-                z, y, x = map(float, match.groups()[::-1])
-                coords.append({"X": x, "Y": y, "Z": z})
+            coords = [
+                {"X": float(x), "Y": float(y), "Z": float(z)}
+                for x, y, z in _LAYOUT_COORD_RE.findall(text)
+            ]
             if coords:
                 layout_by_arr["A1"] = coords
                 total_points = len(coords)
 
-        print(f"✅ Extracted {total_points} points across {len(layout_by_arr)} arrangements (right-to-left layout parsing)")
+        logger.info(f"✅ Extracted {total_points} points across {len(layout_by_arr)} arrangements (right-to-left layout parsing)")
         return layout_by_arr
 
    
@@ -708,7 +1238,8 @@ class FinalPDFExtractor:
     # ROOM EXTRACTION
     # -----------------------------------------------------
     # def _extract_rooms(self, text: str, data: Dict[str, Any]):
-    def _extract_rooms(self, text: str, data: Dict[str, Any], pdf_path: str):
+    def _extract_rooms(self, text: str, data: Dict[str, Any], pdf_path: str,
+                       candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract room information with enhanced layout extraction.
         
@@ -719,20 +1250,9 @@ class FinalPDFExtractor:
         Args:
             text (str): Raw text extracted from the PDF
             data (Dict[str, Any]): Data dictionary to populate with room layout info
+            candidates: Patterns that passed the prefilter (None runs them all)
         """
 
-        # Room name patterns - multiple formats to handle different naming conventions
-        # Pattern 1: "Building 1 · Storey 1 · Room 1" (with bullet separators)
-        # Pattern 2: "Building 1 Storey 1 Room 1" (with space separators)
-        # Pattern 3: "Room 1" (simple room number)
-        # Pattern 4: "Building 1 ... Room 1" (flexible building-room format)
-        room_patterns = [
-            r"(Building\s*\d+\s*·\s*Storey\s*\d+\s*·\s*Room\s*\d+)",  # Bullet-separated format
-            r"(Building\s*\d+\s*Storey\s*\d+\s*Room\s*\d+)",           # Space-separated format
-            r"(Room\s*\d+)",                                           # Simple room number
-            r"(Building\s*\d+.*?Room\s*\d+)"                          # Flexible building-room format
-        ]
-
         # Coordinate patterns - multiple formats to handle different coordinate representations
         # Pattern 1: "4.000 m 36.002 m 7.000 m" (meters with unit labels)
         # Pattern 2: "4000.000 mm 36002.000 mm 7000.000 mm" (millimeters with unit labels)
@@ -745,24 +1265,14 @@ class FinalPDFExtractor:
         #     r"X\s*[:\-]?\s*(\d+\.?\d*)\s*Y\s*[:\-]?\s*(\d+\.?\d*)\s*Z\s*[:\-]?\s*(\d+\.?\d*)"  # Labeled meter coordinates
         # ]
 
-        # Arrangement patterns - multiple formats to handle different arrangement labels
-        # Pattern 1: "Arrangement: A1" or "Arrangement - A1"
-        # Pattern 2: "Layout: A1" or "Layout - A1"
-        # Pattern 3: "Pattern: A1" or "Pattern - A1"
-        # Pattern 4: "A1 arrangement" (reverse format)
-        arrangement_patterns = [
-            r"Arrangement[:\-]?\s*([A-Za-z0-9]+)",  # Standard arrangement label
-            r"Layout[:\-]?\s*([A-Za-z0-9]+)",       # Layout label variant
-            r"Pattern[:\-]?\s*([A-Za-z0-9]+)",      # Pattern label variant
-            r"([A-Za-z0-9]+)\s*arrangement"         # Reverse arrangement format
-        ]
-
         # Collect unique room names using all room patterns
         all_rooms = []
         # Iterate over each regex pattern designed to match room names in various formats
-        for pattern in room_patterns:
+        for pattern in _ROOM_PATTERNS:
+            if not may_match(pattern, candidates):
+                continue
             # Find all matches of the current pattern in the text (case-insensitive)
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             # For each matched room name string
             for match in matches:
                 # Normalize the matched room name using alias mapping or cleaning
@@ -793,18 +1303,21 @@ class FinalPDFExtractor:
 
         # Extract structured layout coordinates using pdfplumber
         # all_coords = self._extract_layout(pdf_path)
-        all_coords = self._extract_layout(text)
-
-        # Extract arrangement patterns from all arrangement regex patterns
-        arrangements = []
-        for pattern in arrangement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)  # Case-insensitive matching
-            arrangements.extend(matches)  # Collect all arrangement matches
+        all_coords = self._extract_layout(text, candidates)
+
+        # Only the first arrangement is used: the layout tables' own
+        # "Arrangement A1" label if there is one, else the first match of the
+        # first arrangement pattern that matches at all, or "A1" if none does.
+        # Stop there instead of collecting every match of every pattern
+        arrangement = "A1"
+        for pattern in (_LAYOUT_ARRANGEMENT_RE,) + _ARRANGEMENT_PATTERNS:
+            match = pattern.search(text) if may_match(pattern, candidates) else None  # Case-insensitive matching
+            if match:
+                arrangement = match.group(1)
+                break
 
         # Assemble room data with extracted information
         for room in all_rooms:
-            # Use first arrangement found, or default to "A1" if none found
-            arrangement = arrangements[0] if arrangements else "A1"
             # Copy all coordinates to each room (shared layout assumption)
             layout = all_coords.copy() if all_coords else []
             
@@ -832,7 +1345,7 @@ class FinalPDFExtractor:
 
         for r in data["rooms"]:
             # clean_name = re.sub(r"\s+", " ", r["name"].strip().lower())
-            clean = re.sub(r"[\W_]+", "", r["name"].lower())
+            clean = _NON_ALNUM_RE.sub("", r["name"].lower())
             if clean not in unique:
                 unique[clean] = r
 
@@ -841,7 +1354,8 @@ class FinalPDFExtractor:
     # -----------------------------------------------------
     # SCENE EXTRACTION
     # -----------------------------------------------------
-    def _extract_scenes(self, text: str, data: Dict[str, Any]):
+    def _extract_scenes(self, text: str, data: Dict[str, Any],
+                        candidates: Optional[Set[re.Pattern]] = None):
         """
         Extract scene data (lighting performance metrics) from the report text.
 
@@ -853,6 +1367,7 @@ class FinalPDFExtractor:
         Args:
             text (str): The full extracted text from the PDF report.
             data (Dict[str, Any]): The main data dictionary to populate with scene info.
+            candidates: Patterns that passed the prefilter (None runs them all)
 
         Populates:
             data["scenes"]: A list of scene dictionaries, each containing extracted metrics.
@@ -861,22 +1376,12 @@ class FinalPDFExtractor:
         # -----------------------------------------------------
         # 1. Attempt to extract scenes using a comprehensive regex pattern
         # -----------------------------------------------------
-        # This pattern is designed to match scene tables with the following structure:
+        # _SCENE_RE is designed to match scene tables with the following structure:
         #   [Scene Name] [Average Lux] [Min Lux] [Max Lux] [Uniformity] [G1] [Index]
         # It supports various label forms (e.g., Ē, Eavg, Average, E) and optional scene names.
-        scene_pattern = re.compile(
-            r"(?:([A-Za-z ]+)\s+)?"
-            r"(?:(?:Ē|Eavg|Average|E)\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Average lux
-            r"[\s\n]+(?:(?:Emin|Min)?\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Min lux
-            r"[\s\n]+(?:(?:Emax|Max)?\s*[:=]?\s*)?([\d.]+)\s*lx?"      # Max lux
-            r"[\s\n]+([\d.]+)"                                         # Uniformity (Uo)
-            r"[\s\n]+([\d.]+)"                                         # G1 (glare index)
-            r"[\s\n]+([A-Za-z0-9]+)",                                  # Index (e.g., CG1)
-            re.UNICODE
-        )
 
         # Find all matches of the scene pattern in the text
-        matches = scene_pattern.findall(text)
+        matches = _SCENE_RE.findall(text) if may_match(_SCENE_RE, candidates) else []
         for sm in matches:
             # sm is a tuple: (scene_name, avg, emin, emax, uo, g1, index)
             # If scene name is missing, use a default label
@@ -903,10 +1408,10 @@ class FinalPDFExtractor:
             alias_scene = {}  # Temporary dict to collect found parameters
 
             # Iterate over all standard parameter names and their aliases
-            for standard, variations in self.aliases["parameters"].items():
-                for alias in variations:
+            for standard, patterns in self._get_scene_alias_patterns().items():
+                for pattern in patterns:
                     # Search for the alias followed by a number (the value)
-                    match = re.search(rf"{alias}\s*[:=]?\s*([\d.]+)", text, re.IGNORECASE)
+                    match = pattern.search(text)
                     if match:
                         # Store the value under the standard parameter name
                         alias_scene[standard] = float(match.group(1))
@@ -956,15 +1461,19 @@ class FinalPDFExtractor:
             "scenes": []                  # Lighting scene performance data
         }
 
+        # One Hyperscan pass over the text finds which section patterns can
+        # match at all; the extractors skip the rest (None without Hyperscan)
+        candidates = candidate_patterns(text, _PREFILTER_DB, _PREFILTERED_RES)
+
         # Execute all extraction methods in sequence
         # Each method populates its respective section of the data structure
         # self._extract_metadata(text, data)           # Extract basic report information
         self._extract_metadata(text, data, pdf_path)           # Extract basic report information
-        self._extract_lighting_setup(text, data)     # Extract lighting system configuration
-        self._extract_luminaires(text, data)         # Extract fixture specifications
+        self._extract_lighting_setup(text, data, candidates)     # Extract lighting system configuration
+        self._extract_luminaires(text, data, candidates)         # Extract fixture specifications
         # self._extract_rooms(text, data)              # Extract room layouts and coordinates
-        self._extract_rooms(text, data, pdf_path)
-        self._extract_scenes(text, data)             # Extract scene performance data
+        self._extract_rooms(text, data, pdf_path, candidates)
+        self._extract_scenes(text, data, candidates)             # Extract scene performance data
 
         return data
 
@@ -977,24 +1486,163 @@ class FinalPDFExtractor:
         2. Parses the text to extract structured data
         3. Returns comprehensive report data
         
+        A PDF with the same contents as one processed before (by this
+        version of the parser) is read back from the cache in self.cache_dir
+        instead.
+        
         Args:
             pdf_path (str): Path to the PDF file to process
             
         Returns:
             Dict[str, Any]: Complete structured data extracted from the PDF
         """
-        print(f"Processing: {pdf_path}")
-        # Extract text using the fallback chain (pdfplumber -> PyMuPDF -> OCR)
-        text = self.extract_text(pdf_path)
-        print(f"Extracted {len(text)} characters")
-        # TEMP DEBUG: Save extracted text to inspect structure
-        debug_txt = os.path.splitext(os.path.basename(pdf_path))[0] + "_debug.txt"
-        with open(debug_txt, "w", encoding="utf-8") as dbg:
-            dbg.write(text)
-        print(f"🧩 Saved extracted text to {debug_txt}")
-
-        # Parse the extracted text into structured data
-        return self.parse_report(text, pdf_path, os.path.basename(pdf_path))
+        logger.info(f"Processing: {pdf_path}")
+        key = None
+        if self.cache_dir:
+            try:
+                key = f"{file_digest(pdf_path)}-{self._settings_digest}.{_PARSER_FINGERPRINT}{_RESULT_CACHE_SUFFIX}"
+            except OSError:
+                pass  # unreadable file; let the extractors report it
+        if key:
+            cached = cache_read(self.cache_dir, key)
+            if cached is not None:
+                try:
+                    data = orjson.loads(cached) if orjson is not None else json.loads(cached)
+                except ValueError:
+                    data = None  # damaged entry; process the PDF and overwrite it
+                if data is not None:
+                    logger.info("Using cached result")
+                    # Same contents may have been cached under another file name
+                    data["metadata"]["report_title"] = os.path.basename(pdf_path)
+                    return data
+
+        # The extractors and the metadata step share one opened document per
+        # library for this PDF instead of each opening the file again
+        with self._pdf_session(pdf_path):
+            # Extract text using the fallback chain (PyMuPDF -> pypdfium2 -> pdfplumber -> OCR)
+            text = self.extract_text(pdf_path)
+            logger.info(f"Extracted {len(text)} characters")
+            # TEMP DEBUG: Save extracted text to inspect structure
+            debug_txt = os.path.splitext(os.path.basename(pdf_path))[0] + "_debug.txt"
+            with open(debug_txt, "w", encoding="utf-8") as dbg:
+                dbg.write(text)
+            logger.info(f"🧩 Saved extracted text to {debug_txt}")
+
+            # Parse the extracted text into structured data
+            data = self.parse_report(text, pdf_path, os.path.basename(pdf_path))
+        # Empty text usually means a failed extraction; don't cache it
+        extracted = bool(text)
+        # The text can run to megabytes; release it before the result is
+        # serialized so it isn't held alongside the JSON copy
+        del text
+        if key and extracted:
+            if orjson is not None:
+                cache_write(self.cache_dir, key, orjson.dumps(data).decode("utf-8"))
+            else:
+                cache_write(self.cache_dir, key, json.dumps(data, ensure_ascii=False))
+        return data
+
+    def process_reports(self, pdf_paths: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process several PDFs, spreading them across worker processes.
+        
+        Each worker builds one extractor (aliases loaded, patterns compiled)
+        when the pool starts and reuses it for every file it is given, so the
+        setup cost is paid once per worker instead of once per PDF.
+        
+        A file that fails doesn't stop the batch: its entry is
+        {"report_title", "error"} instead of a result.
+        
+        Args:
+            pdf_paths (List[str]): Paths of the PDF files to process
+            workers (int): Worker processes to use (default: one per CPU)
+            
+        Returns:
+            List[Dict[str, Any]]: process_report() results or error entries,
+                in pdf_paths order
+        """
+        workers = min(workers or os.cpu_count() or 1, len(pdf_paths))
+        if workers <= 1:
+            return [self._process_report_entry(pdf_path) for pdf_path in pdf_paths]
+
+        # Workers queue their log records; a listener thread here hands them
+        # to this process's handlers so output from several files never interleaves
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *logging.getLogger().handlers, respect_handler_level=True
+        )
+        listener.start()
+        try:
+            initargs = (self.alias_path, self.backend, self.ocr, self.cache_dir,
+                        log_queue, logging.getLogger().getEffectiveLevel())
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_report_worker,
+                                     initargs=initargs) as executor:
+                return list(executor.map(_process_report_in_worker, pdf_paths))
+        finally:
+            listener.stop()
+
+    def _process_report_entry(self, pdf_path: str) -> Dict[str, Any]:
+        """process_report() for one batch entry, reporting errors instead of raising"""
+        try:
+            return self.process_report(pdf_path)
+        except Exception as e:
+            logger.error(f"✗ Error processing {pdf_path}: {e}")
+            return {"report_title": os.path.basename(pdf_path), "error": str(e)}
+
+
+# -----------------------------------------------------
+# BATCH WORKERS
+# -----------------------------------------------------
+# Per-process extractor for process_reports(), built by the pool initializer
+_WORKER_EXTRACTOR = None
+
+
+def _init_report_worker(alias_path: str, backend: Optional[str], ocr: bool, cache_dir: Optional[str],
+                        log_queue, log_level: int):
+    """Pool initializer: route logging to the parent and build this worker's extractor"""
+    global _WORKER_EXTRACTOR
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+    _WORKER_EXTRACTOR = FinalPDFExtractor(alias_path, backend=backend, ocr=ocr)
+    _WORKER_EXTRACTOR.cache_dir = cache_dir
+    # Files are already spread over the pool; one process per file
+    _WORKER_EXTRACTOR.workers = 1
+
+
+def _process_report_in_worker(pdf_path: str) -> Dict[str, Any]:
+    """process_report() on this worker's extractor, reporting errors instead of raising"""
+    return _WORKER_EXTRACTOR._process_report_entry(pdf_path)
+
+
+def _expand_pdf_args(args: List[str]) -> List[str]:
+    """PDF paths from command-line arguments: files, folders of PDFs, or glob patterns"""
+    pdf_paths = []
+    for arg in args:
+        if os.path.isdir(arg):
+            pdf_paths.extend(sorted(glob.glob(os.path.join(arg, "*.pdf"))))
+        elif glob.has_magic(arg):
+            pdf_paths.extend(sorted(glob.glob(arg)))  # e.g. quoted patterns, or shells that don't expand them
+        else:
+            pdf_paths.append(arg)
+    return pdf_paths
+
+
+def _save_result(result: Dict[str, Any], pdf_path: str) -> str:
+    """Write a result next to the working directory as <pdf name>_extracted.json"""
+    # Generate output filename based on input PDF name
+    out_file = f"{os.path.basename(pdf_path)}_extracted.json"
+    
+    # Save extracted data to JSON file with proper formatting
+    # (pretty-printed UTF-8, serialized up front and written in one call)
+    if orjson is not None:
+        output = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        output = json.dumps(result, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(out_file, "wb") as f:
+        f.write(output)
+    return out_file
+
     
 # -----------------------------------------------------
 # MAIN EXECUTION BLOCK
@@ -1004,39 +1652,73 @@ if __name__ == "__main__":
     Main execution block for command-line usage of the Final PDF Extractor.
     
     This block handles command-line arguments and orchestrates the PDF processing
-    workflow. It can accept a PDF file path as an argument or use a default file.
+    workflow. Each PDF's result is saved as <pdf name>_extracted.json in the
+    current directory.
     
     Usage:
-        python final_extractor.py [pdf_file_path]
+        python final_extractor.py report.pdf
+        python final_extractor.py report1.pdf report2.pdf ... [--workers N]
+        python final_extractor.py reports_folder/ [--backend pdfium] [--no-ocr]
         
-    If no file path is provided, it will use the default PDF file.
+    Several files (or a folder, or a glob pattern) are processed in parallel
+    with process_reports(). If no file path is provided, it prints usage and exits.
     """
-    # Initialize the extractor with alias mapping for improved field recognition
-    extractor = FinalPDFExtractor("aliases.json")
-    
-    # Get PDF path from command line argument or use default
-    if len(sys.argv) > 1:
-        pdf_path = sys.argv[1]  # Use provided file path
-    else:
+    parser = argparse.ArgumentParser(description="Extract structured data from lighting report PDFs")
+    parser.add_argument("pdfs", nargs="*",
+                        help="PDF files, folders of PDFs, or glob patterns")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes for several PDFs (default: CPU count)")
+    parser.add_argument("--backend", choices=TEXT_BACKENDS, default=None,
+                        help="Text extractor to try first (default: pymupdf)")
+    parser.add_argument("--no-ocr", action="store_true",
+                        help="Never fall back to OCR; scanned PDFs give little or no text")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="Result cache folder; an empty string disables the cache "
+                             "(default: REPORT_EXPORT_CACHE or ~/.cache/report_export)")
+    parser.add_argument("--aliases", default="aliases.json",
+                        help="Alias file, relative to the extractors folder (default: aliases.json)")
+    args = parser.parse_args()
+
+    # Dump a traceback if a C extension (MuPDF, PDFium, Tesseract) crashes mid-batch
+    faulthandler.enable()
+
+    # Status messages go through logging; records are queued and a listener
+    # thread writes them to the console, so extraction never waits on output
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    atexit.register(listener.stop)  # drain the queue before the interpreter exits
+
+    # Get PDF paths from the command line arguments
+    pdf_paths = _expand_pdf_args(args.pdfs)
+    if not pdf_paths:
         # If no PDF file path is provided, print a detailed error message in red and exit.
         # This prevents accidental processing with a hardcoded default file and ensures
         # the user is clearly informed about the correct usage.
         error_msg = (
             "\033[91m[ERROR]\033[0m No PDF file path provided.\n"
-            "Usage: python final_extractor.py [pdf_file_path]\n"
+            "Usage: python final_extractor.py [options] pdf_file_path [pdf_file_path ...]\n"
             "Please specify the path to the PDF file you want to process."
         )
         print(error_msg)
         sys.exit(1)
-    
-    # Process the PDF and extract structured data
-    result = extractor.process_report(pdf_path)
 
-    # Generate output filename based on input PDF name
-    out_file = f"{os.path.basename(pdf_path)}_extracted.json"
-    
-    # Save extracted data to JSON file with proper formatting
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=4, ensure_ascii=False)  # Pretty-print JSON with UTF-8 encoding
+    # Initialize the extractor with alias mapping for improved field recognition
+    extractor = FinalPDFExtractor(args.aliases, backend=args.backend, ocr=not args.no_ocr)
+    extractor.cache_dir = args.cache_dir
+
+    # Process the PDFs and extract structured data
+    if len(pdf_paths) == 1:
+        results = [extractor.process_report(pdf_paths[0])]
+    else:
+        results = extractor.process_reports(pdf_paths, workers=args.workers)
 
-    print(f"✓ Results saved to {out_file}")
+    for pdf_path, result in zip(pdf_paths, results):
+        if "error" in result:
+            continue  # already logged by process_reports()
+        out_file = _save_result(result, pdf_path)
+        logger.info(f"✓ Results saved to {out_file}")
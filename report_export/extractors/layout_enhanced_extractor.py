@@ -66,15 +66,17 @@ class LayoutEnhancedExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        # Collect page texts and join once; repeated += copies the text per page
+        parts = []
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 for page in pdf.pages:
-                    if page.extract_text():
-                        text += page.extract_text() + "\n"
+                    page_text = page.extract_text()
+                    if page_text:
+                        parts.append(page_text)
         except Exception as e:
             print(f"pdfplumber error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def _extract_with_pymupdf(self, pdf_path: str) -> str:
         """
@@ -90,17 +92,17 @@ class LayoutEnhancedExtractor:
         Returns:
             str: Extracted text content, or empty string if extraction fails
         """
-        text = ""
+        parts = []
         try:
             import fitz
             doc = fitz.open(pdf_path)
             for page_num in range(len(doc)):
                 page = doc.load_page(page_num)
-                text += page.get_text() + "\n"
+                parts.append(page.get_text())
             doc.close()
         except Exception as e:
             print(f"PyMuPDF error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def _ocr_pdf(self, pdf_path: str) -> str:
         """
@@ -116,14 +118,14 @@ class LayoutEnhancedExtractor:
         Returns:
             str: OCR extracted text content, or empty string if extraction fails
         """
-        text = ""
+        parts = []
         try:
             pages = convert_from_path(pdf_path, dpi=300)
             for page in pages:
-                text += pytesseract.image_to_string(page) + "\n"
+                parts.append(pytesseract.image_to_string(page))
         except Exception as e:
             print(f"OCR error: {e}")
-        return text.strip()
+        return "\n".join(parts).strip()
     
     def extract_text(self, pdf_path: str) -> str:
         """
@@ -0,0 +1,95 @@
+"""
+Regression tests for the final extractor
+========================================
+
+Rooms and layout that extractors/final_extractor.py has to keep extracting
+from the sample report.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors import final_extractor
+from extractors.final_extractor import FinalPDFExtractor
+
+TEST_PDF_PATH = os.path.join(os.path.dirname(__file__), '..', 'NESSTRA Report With 150 watt.pdf')
+
+EXPECTED_ROOM_NAMES = ['building 1 · storey 1 · room 1', 'room 1']
+
+# The A1 table runs over a page break: 13 points on the first page and 23
+# under the repeated header on the next, all one arrangement
+EXPECTED_LAYOUT_POINTS = 36
+EXPECTED_FIRST_POINTS = [
+    {'X': 4.0, 'Y': 36.002, 'Z': 7.0},
+    {'X': 8.0, 'Y': 36.002, 'Z': 7.0},
+]
+
+
+@unittest.skipUnless(os.path.exists(TEST_PDF_PATH), "sample report not available")
+class TestFinalExtractorRooms(unittest.TestCase):
+    """Rooms and layout of the sample report (PyMuPDF text)"""
+
+    @classmethod
+    def setUpClass(cls):
+        # process_report writes a <name>_debug.txt into the working directory
+        cls.cwd = os.getcwd()
+        cls.tmp_dir = tempfile.mkdtemp()
+        os.chdir(cls.tmp_dir)
+        extractor = FinalPDFExtractor(backend="pymupdf", ocr=False)
+        extractor.cache_dir = ""
+        cls.result = extractor.process_report(TEST_PDF_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.cwd)
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def test_room_names(self):
+        """Both room headings are found"""
+        self.assertEqual([room['name'] for room in self.result['rooms']], EXPECTED_ROOM_NAMES)
+
+    def test_room_arrangement(self):
+        """The arrangement comes from the layout table's "Arrangement A1" label"""
+        for room in self.result['rooms']:
+            self.assertEqual(room['arrangement'], 'A1')
+
+    def test_page_split_layout(self):
+        """The continuation table on the next page is merged into A1"""
+        for room in self.result['rooms']:
+            self.assertEqual(list(room['layout']), ['A1'])
+            self.assertEqual(len(room['layout']['A1']), EXPECTED_LAYOUT_POINTS)
+            self.assertEqual(room['layout']['A1'][:2], EXPECTED_FIRST_POINTS)
+
+
+@unittest.skipUnless(os.path.exists(TEST_PDF_PATH), "sample report not available")
+class TestFinalExtractorResultCache(unittest.TestCase):
+    """On-disk result cache keys"""
+
+    def setUp(self):
+        # process_report writes a <name>_debug.txt into the working directory
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.mkdtemp()
+        os.chdir(self.tmp_dir)
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.extractor = FinalPDFExtractor(backend="pymupdf", ocr=False)
+        self.extractor.cache_dir = self.cache_dir
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_parser_change_invalidates_results(self):
+        """A result cached by another version of the parser isn't reused"""
+        self.extractor.process_report(TEST_PDF_PATH)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        with patch.object(final_extractor, '_PARSER_FINGERPRINT', 'edited'):
+            self.extractor.process_report(TEST_PDF_PATH)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Regression tests for the shared parser patterns
+===============================================
+
+Rows from real reports that the regexes in extractors/_shared_patterns.py
+(and the sections in extractors/_shared_sections.py) have to keep parsing
+the same way.
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors._shared_patterns import LUMINAIRE_RE
+from extractors._shared_sections import extract_scenes
+
+# final_extractor-backup2.py keeps its own copy of the luminaire pattern; its
+# file name isn't a valid module name, so load it by path
+_BACKUP2_PATH = os.path.join(os.path.dirname(__file__), '..', 'extractors', 'final_extractor-backup2.py')
+
+
+# A luminaire row whose article text is longer than 60 characters
+LONG_ARTICLE_ROW = (
+    "12 Philips BY698P LED265CW G2 WB PSD-VPC 4000K Highbay Luminaire Wide Beam 1 Version 3 "
+    "150.0 W 21750 lm 145.0 lm/W"
+)
+LONG_ARTICLE_MATCH = (
+    "12",
+    "Philips",
+    "BY698P LED265CW G2 WB PSD-VPC 4000K Highbay Luminaire Wide Beam 1 Version 3",
+    "150.0",
+    "21750",
+    "145.0",
+)
+
+
+class TestLuminairePattern(unittest.TestCase):
+    """LUMINAIRE_RE row parsing"""
+
+    def test_long_article(self):
+        """A long article keeps the row's own quantity and manufacturer"""
+        self.assertEqual(LUMINAIRE_RE.findall(LONG_ARTICLE_ROW), [LONG_ARTICLE_MATCH])
+
+
+class TestSceneSection(unittest.TestCase):
+    """extract_scenes() scene rows"""
+
+    def test_every_scene_kept(self):
+        """Large reports keep all their scenes"""
+        names = [f"Bay {chr(97 + n // 26)}{chr(97 + n % 26)}" for n in range(40)]
+        text = "\n".join(f"{name} {100 + n}.0 lx 50.0 lx 150.0 lx 0.5" for n, name in enumerate(names))
+        data = {"scenes": []}
+        extract_scenes(text, data)
+        self.assertEqual(len(data["scenes"]), 40)
+        self.assertEqual(data["scenes"][-1]["average_lux"], 139.0)
+
+
+class TestBackup2LuminairePattern(unittest.TestCase):
+    """final_extractor-backup2's _LUMINAIRE_RE row parsing"""
+
+    @classmethod
+    def setUpClass(cls):
+        spec = importlib.util.spec_from_file_location("final_extractor_backup2", _BACKUP2_PATH)
+        cls.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.module)
+
+    def test_long_article(self):
+        """A long article keeps the row's own quantity and manufacturer"""
+        self.assertEqual(self.module._LUMINAIRE_RE.findall(LONG_ARTICLE_ROW), [LONG_ARTICLE_MATCH])
+
+
+if __name__ == '__main__':
+    unittest.main()